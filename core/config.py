@@ -7,7 +7,7 @@ import logging
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from utils.constants import CONFIG_FILE, UPDATE_CHECK_DEFAULTS
 
@@ -180,10 +180,11 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Failed to save custom field names: {e}")
 
-    def load_custom_field_names(self) -> Dict[str, str]:
-        """Load custom field names"""
+    def load_custom_field_names(self, config: Optional[Dict] = None) -> Dict[str, str]:
+        """Load custom field names (from an already loaded config when given)"""
         try:
-            config = self.load_config()
+            if config is None:
+                config = self.load_config()
             custom_names = config.get("custom_field_names", {})
             logger.info(f"Loaded custom field names: {custom_names}")
             return custom_names
@@ -194,27 +195,45 @@ class ConfigManager:
     def save_field_state(self, disabled_fields: list) -> None:
         """Save field state configuration"""
         try:
-            def update(config):
-                config["disabled_fields"] = disabled_fields
-                config["hidden_fields"] = disabled_fields
-                config["field_visibility"] = {
-                    field_id: field_id not in disabled_fields
-                    for field_id in disabled_fields
-                }
-            self._update_config(update)
+            self._update_config(lambda config: self._set_field_state(config, disabled_fields))
             logger.info(f"Saved field state: {len(disabled_fields)} disabled fields")
         except Exception as e:
             logger.error(f"Failed to save field state: {e}")
 
+    @staticmethod
+    def _set_field_state(config: Dict, disabled_fields: list) -> None:
+        """Write disabled fields under both the new and the old (hidden_fields) keys"""
+        config["disabled_fields"] = disabled_fields
+        config["hidden_fields"] = disabled_fields
+        config["field_visibility"] = {
+            field_id: field_id not in disabled_fields
+            for field_id in disabled_fields
+        }
+
+    def save_field_configuration(self, custom_names: Dict[str, str], disabled_fields: list,
+                                 active_template: str) -> None:
+        """Save custom field names, field state and active template in a single config write"""
+        try:
+            def update(config):
+                config["custom_field_names"] = custom_names
+                self._set_field_state(config, disabled_fields)
+                config["active_template"] = active_template
+            self._update_config(update)
+            logger.info(f"Saved field configuration: {len(custom_names)} custom names, "
+                        f"{len(disabled_fields)} disabled fields, template '{active_template}'")
+        except Exception as e:
+            logger.error(f"Failed to save field configuration: {e}")
+
     # Backward compatibility alias
     def save_field_visibility(self, hidden_fields: list) -> None:
         """Backward compatibility alias for save_field_state."""
         self.save_field_state(hidden_fields)
 
-    def load_field_state(self) -> list:
-        """Load field state configuration"""
+    def load_field_state(self, config: Optional[Dict] = None) -> list:
+        """Load field state configuration (from an already loaded config when given)"""
         try:
-            config = self.load_config()
+            if config is None:
+                config = self.load_config()
             # Support both new and old key names for backward compatibility
             disabled_fields = config.get("disabled_fields", config.get("hidden_fields", []))
             logger.info(f"Loaded field state: {len(disabled_fields)} disabled fields")
@@ -238,10 +257,11 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Failed to save active template: {e}")
 
-    def load_active_template(self) -> str:
-        """Load the active template name"""
+    def load_active_template(self, config: Optional[Dict] = None) -> str:
+        """Load the active template name (from an already loaded config when given)"""
         try:
-            config = self.load_config()
+            if config is None:
+                config = self.load_config()
             return config.get("active_template", "")
         except Exception as e:
             logger.error(f"Failed to load active template: {e}")
@@ -5,7 +5,7 @@ Separates internal field IDs from user-configurable display names.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 
 class FieldType(Enum):
@@ -216,6 +216,28 @@ REQUIRED_ENABLED_FIELDS = ['startdatum', 'kalla1', 'handelse']
 # Backward compatibility alias
 REQUIRED_VISIBLE_FIELDS = REQUIRED_ENABLED_FIELDS
 
+# Fields that get a lock switch (all except the automatically filled Dag and Inlagd)
+LOCKABLE_FIELDS = frozenset(field_id for field_id in FIELD_DEFINITIONS if field_id not in ('dag', 'inlagd'))
+
+# Lookup tables built once at import for the common case of no custom field names
+BUILTIN_DISPLAY_NAMES: Dict[str, str] = {
+    field_id: field_def.default_display_name for field_id, field_def in FIELD_DEFINITIONS.items()
+}
+
+# Field ids partitioned by whether they can be renamed (in FIELD_DEFINITIONS order)
+PROTECTED_FIELDS: Tuple[str, ...] = tuple(
+    field_id for field_id, field_def in FIELD_DEFINITIONS.items() if field_def.protected
+)
+RENAMABLE_FIELDS: Tuple[str, ...] = tuple(
+    field_id for field_id, field_def in FIELD_DEFINITIONS.items() if not field_def.protected
+)
+
+COLUMN_MEMBERSHIP: Dict[str, FrozenSet[str]] = {
+    column_group: frozenset(field_id for field_id, field_def in FIELD_DEFINITIONS.items()
+                            if field_def.column_group == column_group)
+    for column_group in {field_def.column_group for field_def in FIELD_DEFINITIONS.values()}
+}
+
 
 class FieldDefinitionManager:
     """Manages field definitions and custom field names."""
@@ -257,13 +279,11 @@ class FieldDefinitionManager:
 
     def get_renamable_fields(self) -> List[str]:
         """Get list of field IDs that can be renamed."""
-        return [field_id for field_id, field_def in FIELD_DEFINITIONS.items()
-                if not field_def.protected]
+        return list(RENAMABLE_FIELDS)
 
     def get_protected_fields(self) -> List[str]:
         """Get list of field IDs that are protected."""
-        return [field_id for field_id, field_def in FIELD_DEFINITIONS.items()
-                if field_def.protected]
+        return list(PROTECTED_FIELDS)
 
     def set_custom_name(self, internal_id: str, display_name: str) -> bool:
         """Set a custom display name for a field."""
@@ -287,6 +307,10 @@ class FieldDefinitionManager:
         """Reset all fields to their default display names."""
         self._custom_names.clear()
 
+    def has_custom_names(self) -> bool:
+        """Check if any field has a custom display name."""
+        return bool(self._custom_names)
+
     def get_custom_names(self) -> Dict[str, str]:
         """Get all custom field names."""
         return self._custom_names.copy()
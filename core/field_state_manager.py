@@ -4,7 +4,7 @@ Manages which fields are disabled/enabled and preserves data when fields are dis
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,12 @@ class FieldStateManager:
         self._disabled_fields: Set[str] = set()
         self._preserved_data: Dict[str, str] = {}
         self._preserved_formats: Dict[str, any] = {}  # For rich text fields
+        # Frozen copy of the disabled set, dropped whenever the set changes
+        self._disabled_snapshot: Optional[FrozenSet[str]] = None
+
+    def _disabled_fields_changed(self) -> None:
+        """Invalidate cached views of the disabled field set."""
+        self._disabled_snapshot = None
 
     def can_disable_field(self, field_id: str) -> bool:
         """
@@ -57,6 +63,7 @@ class FieldStateManager:
             return False
 
         self._disabled_fields.add(field_id)
+        self._disabled_fields_changed()
 
         # Preserve data if provided
         if current_value:
@@ -86,6 +93,7 @@ class FieldStateManager:
             Tuple of (preserved_value, preserved_format) or ("", None) if no data
         """
         self._disabled_fields.discard(field_id)
+        self._disabled_fields_changed()
 
         # Return preserved data if available
         value = self._preserved_data.pop(field_id, "")
@@ -145,6 +153,17 @@ class FieldStateManager:
         """
         return list(self._disabled_fields)
 
+    def get_disabled_field_set(self) -> FrozenSet[str]:
+        """
+        Get the disabled field IDs as a frozenset, rebuilt only when the set changes.
+
+        Returns:
+            Frozenset of disabled field IDs
+        """
+        if self._disabled_snapshot is None:
+            self._disabled_snapshot = frozenset(self._disabled_fields)
+        return self._disabled_snapshot
+
     # Backward compatibility alias
     def get_hidden_fields(self) -> List[str]:
         """Backward compatibility alias for get_disabled_fields."""
@@ -179,6 +198,7 @@ class FieldStateManager:
             f for f in disabled_fields
             if self.can_disable_field(f)
         }
+        self._disabled_fields_changed()
 
         # Log any fields that couldn't be disabled
         invalid = [f for f in disabled_fields if not self.can_disable_field(f)]
@@ -221,6 +241,7 @@ class FieldStateManager:
     def reset_all_enabled(self) -> None:
         """Reset all fields to enabled state."""
         self._disabled_fields.clear()
+        self._disabled_fields_changed()
         logger.info("All fields reset to enabled")
 
     # Backward compatibility alias
@@ -8,6 +8,12 @@ from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# PDF text cleanup patterns for FilenameParser.clean_pdf_text
+_HYPHEN_BREAK_RE = re.compile(r'(\w)-\n')
+_SOFT_BREAK_RE = re.compile(r'(\w)(?: \n|(,)\n|\n(?![.!?:;\n]))')
+_EXTRA_BREAKS_RE = re.compile(r'\n{3,}')
+_MULTI_SPACE_RE = re.compile(r' +')
+
 
 class FilenameParser:
     """Parses and constructs PDF filenames"""
@@ -118,48 +124,20 @@ class FilenameParser:
 
         # Step 2: Remove hyphen + line break (word continuation)
         # Pattern: word-\n → word
-        text = re.sub(r'(\w)-\n', r'\1', text)
-
-        # Step 3: Handle line breaks after punctuation (keep these)
-        # Pattern: word.\n or word. \n → keep as is (paragraph breaks)
-        # This is handled by NOT modifying these patterns
-
-        # Step 4: Remove line break after word + space
-        # Pattern: word \n → word (remove just the line break)
-        text = re.sub(r'(\w) \n', r'\1 ', text)
-
-        # Step 5: Replace line break after word (no space, no punctuation)
-        # Pattern: word\n → word (space)
-        # But avoid cases where the line break is after sentence-ending punctuation
-        text = re.sub(r'(\w)\n(?![.!?:;\n])', r'\1 ', text)
-
-        # Step 6: Handle line breaks after punctuation that should be kept
-        # Ensure colon and semicolon breaks are preserved
-        # Pattern: word:\n or word;\n → keep (already preserved above)
-
-        # Step 7: Handle commas - add space after line break
-        # Pattern: word,\n → word, (space)
-        text = re.sub(r'(\w),\n', r'\1, ', text)
+        text = _HYPHEN_BREAK_RE.sub(r'\1', text)
 
-        # Step 8: Handle line breaks after numbers/dates
-        # Pattern: 123\n → 123 (space)
-        text = re.sub(r'(\d)\n(?![.!?:;\n])', r'\1 ', text)
+        # Steps 3-8 in one pass: line breaks after punctuation are kept (paragraph breaks), while
+        # word \n → word (space), word,\n → word, (space) and word\n / 123\n → word (space)
+        # unless the next line starts with sentence punctuation or is a paragraph break
+        text = _SOFT_BREAK_RE.sub(r'\1\2 ', text)
 
         # Step 9: Normalize multiple line breaks (max 2 for paragraph separation)
         # Pattern: \n\n\n+ → \n\n
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXTRA_BREAKS_RE.sub('\n\n', text)
 
         # Step 10: Clean up excessive whitespace
-        # Remove leading/trailing whitespace and normalize internal spaces
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Trim each line and normalize internal spaces
-            cleaned_line = re.sub(r' +', ' ', line.strip())
-            cleaned_lines.append(cleaned_line)
-
-        # Join lines back and do final cleanup
-        text = '\n'.join(cleaned_lines)
+        # Trim each line and normalize internal spaces, then join lines back
+        text = '\n'.join(_MULTI_SPACE_RE.sub(' ', line.strip()) for line in text.split('\n'))
 
         # Final trim of the entire text
         text = text.strip()
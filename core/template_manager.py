@@ -3,12 +3,13 @@ Template manager for field configuration templates.
 Handles saving, loading, and managing field configuration templates.
 """
 
+import copy
 import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,9 @@ class TemplateManager:
     def __init__(self):
         """Initialize the template manager."""
         self.templates_dir = self._get_templates_directory()
+        # Resolved template path -> (file mtime in ns, field config) for templates loaded or saved this session.
+        # A hit is only served while the file's mtime is unchanged, so edits and deletes outside the app are seen.
+        self._template_configs: Dict[Path, Tuple[int, Dict]] = {}
         self._ensure_directory_exists()
         self._ensure_default_template()
 
@@ -185,6 +189,7 @@ class TemplateManager:
                 json.dump(template_data, f, indent=2, ensure_ascii=False)
             os.replace(temp_path, file_path)
             logger.info(f"Saved template: {name}")
+            self._template_configs[file_path] = (file_path.stat().st_mtime_ns, copy.deepcopy(field_config_with_compat))
             return True
         except Exception as e:
             logger.error(f"Failed to save template: {e}")
@@ -222,6 +227,12 @@ class TemplateManager:
             return None
 
         try:
+            mtime = file_path.stat().st_mtime_ns
+            cached = self._template_configs.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                logger.info(f"Loaded template: {name} (cached)")
+                return copy.deepcopy(cached[1])
+
             with open(file_path, encoding='utf-8') as f:
                 template_data = json.load(f)
 
@@ -238,6 +249,7 @@ class TemplateManager:
                 field_config["hidden_fields"] = field_config["disabled_fields"]
 
             logger.info(f"Loaded template: {name}")
+            self._template_configs[file_path] = (mtime, copy.deepcopy(field_config))
             return field_config
 
         except json.JSONDecodeError as e:
@@ -279,6 +291,7 @@ class TemplateManager:
             # Delete the template
             file_path.unlink()
             logger.info(f"Deleted template: {name}")
+            self._template_configs.pop(file_path, None)
             return True
 
         except Exception as e:
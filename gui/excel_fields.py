@@ -6,24 +6,53 @@ Contains all Excel field creation and management methods extracted from main_win
 # Standard library imports
 import logging
 import tkinter as tk
-from typing import Any, Dict, List, Tuple
+from contextlib import contextmanager
+from datetime import date
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
 
 # Third-party GUI imports
 import customtkinter as ctk
 
-from core.field_definitions import field_manager
+from core.field_definitions import BUILTIN_DISPLAY_NAMES, COLUMN_MEMBERSHIP, FIELD_ORDER, LOCKABLE_FIELDS, field_manager
 from core.field_state_manager import field_state_manager
 from gui.field_styling import apply_field_state
-from gui.utils import ScrollableText
+from gui.utils import ScrollableText, get_hover_color
 
 # Local imports
 
 logger = logging.getLogger(__name__)
 
+# Rich text tags that are persisted for locked text fields
+_FORMATTING_TAGS = frozenset({'bold', 'red', 'blue', 'green', 'black'})
+
+# Row background color buttons (value, label, color) - enlarged for better usability
+ROW_COLOR_OPTIONS = (
+    ("none", "Ingen", "#FFFFFF"),
+    ("yellow", "Gul", "#FFF59D"),
+    ("green", "Grön", "#C8E6C9"),
+    ("blue", "Blå", "#BBDEFB"),
+    ("red", "Röd", "#FFCDD2"),
+    ("pink", "Rosa", "#F8BBD9"),
+    ("gray", "Grå", "#E0E0E0"),
+)
+
+# Fully resolved button colors: (value, label, fill, hover, text_color)
+ROW_COLOR_TABLE = tuple(
+    (value, text, color, get_hover_color(color), "#333333" if value != "none" else "#666666")
+    for value, text, color in ROW_COLOR_OPTIONS
+)
+
 
 class ExcelFieldManager:
     """Manages Excel field creation, layout, and state management"""
 
+    # Minimum PanedWindow width before the 3-column sash positions are applied
+    MIN_SASH_LAYOUT_WIDTH = 600
+
+    # Shared CTkFont instances keyed by (size, options) - fonts are never mutated after creation
+    _font_cache: Dict[tuple, ctk.CTkFont] = {}
+
     def __init__(self, parent_app):
         """Initialize Excel field manager with reference to parent application"""
         self.parent = parent_app
@@ -31,14 +60,106 @@ class ExcelFieldManager:
         # Text fields that support rich text formatting (using internal IDs)
         self.text_field_ids = {'note1', 'note2', 'note3', 'handelse'}
 
-    def _is_text_field(self, field_id: str) -> bool:
-        """Check if a field is a text field that supports rich text formatting"""
-        return field_id in self.text_field_ids
+        # Field-specific builders for create_field_in_frame; other fields use their column's layout
+        self._field_builders: Dict[str, Callable] = {
+            'dag': self._create_dag_field,
+            'inlagd': self._create_inlagd_field,
+        }
+        for text_field_id in self.text_field_ids:
+            self._field_builders[text_field_id] = self._create_text_field
+        self._column_builders: Dict[str, Callable] = {'column1': self._create_horizontal_field}
+
+        # Widget kind ('text' or 'stringvar') per display name, reset on every field rebuild
+        self._widget_kind_cache: Dict[str, str] = {}
+
+        # Disabled field IDs resolved once per field rebuild
+        self._disabled_set: frozenset = frozenset()
+
+        # (field_widgets, field_id, is_disabled) styling queued by create_field_in_frame
+        self._pending_style_ops: List[Tuple[Dict[str, Any], str, bool]] = []
+
+        # Text widget rows that should expand, per column frame, configured after the build
+        self._pending_row_weights: Dict[Any, List[int]] = {}
+
+        # Event handlers keyed by (kind, field name), reused across rebuilds instead of fresh lambdas
+        self._field_handlers: Dict[Tuple[str, str], Callable] = {}
+
+        # Manually connected (placeholder-preserving) entries keyed by StringVar Tcl name
+        self._connected_entries: Dict[str, Tuple[Any, tk.StringVar]] = {}
+        self._syncing_vars: set = set()
+
+        # Display name <-> field ID lookups, cleared on rebuild since custom names may have changed
+        self._display_to_id_cache: Dict[str, str] = {}
+        self._id_to_display_cache: Dict[str, str] = {}
+
+    def _font(self, size: int, **options) -> ctk.CTkFont:
+        """Return a cached CTkFont so field rebuilds don't allocate a Tk font per widget"""
+        key = (size, tuple(sorted(options.items())))
+        font = self._font_cache.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, **options)
+            self._font_cache[key] = font
+        return font
+
+    def _field_handler(self, kind: str, field_name: str) -> Callable:
+        """Return a cached event handler of the given kind for a field, built once per field name"""
+        key = (kind, field_name)
+        handler = self._field_handlers.get(key)
+        if handler is None:
+            if kind == 'char_count':
+                handler = partial(self.parent.check_character_count, column_name=field_name)
+            elif kind == 'validate_date':
+                handler = partial(self.parent.validate_date_field, field_name=field_name)
+            elif kind == 'validate_time':
+                handler = partial(self.parent.validate_time_field, field_name=field_name)
+            elif kind == 'char_count_deferred':
+                handler = partial(self._run_after_idle, self._field_handler('char_count', field_name))
+            elif kind == 'validate_date_deferred':
+                handler = partial(self._run_after, 10, self._field_handler('validate_date', field_name))
+            elif kind == 'validate_time_deferred':
+                handler = partial(self._run_after, 10, self._field_handler('validate_time', field_name))
+            else:
+                raise ValueError(f"Unknown field handler kind: {kind}")
+            self._field_handlers[key] = handler
+        return handler
+
+    def _queue_disabled_styling(self, field_id: str, is_field_disabled: bool, label, input_widget,
+                                lock_switch=None) -> None:
+        """Queue disabled styling for a field; the queue is applied in one pass once all fields are built"""
+        if not is_field_disabled:
+            return
+        field_widgets = {'label': label, 'input': input_widget}
+        if lock_switch:
+            field_widgets['checkbox'] = lock_switch
+        self._pending_style_ops.append((field_widgets, field_id, is_field_disabled))
+
+    def _run_after(self, delay_ms: int, handler: Callable, event) -> None:
+        """Run handler(event) after delay_ms, letting Tk finish processing the triggering event first"""
+        self.parent.root.after(delay_ms, handler, event)
+
+    def _run_after_idle(self, handler: Callable, event) -> None:
+        """Run handler(event) once Tk is idle, i.e. after the triggering event's default bindings"""
+        self.parent.root.after_idle(handler, event)
 
     def _get_field_id_from_display_name(self, display_name: str) -> str:
         """Get internal field ID from display name"""
-        internal_id = field_manager.get_internal_id(display_name)
-        return internal_id if internal_id else display_name.lower()
+        field_id = self._display_to_id_cache.get(display_name)
+        if field_id is None:
+            internal_id = field_manager.get_internal_id(display_name)
+            field_id = internal_id if internal_id else display_name.lower()
+            self._display_to_id_cache[display_name] = field_id
+        return field_id
+
+    def _get_display_name(self, field_id: str) -> str:
+        """Get current display name for an internal field ID"""
+        display_name = self._id_to_display_cache.get(field_id)
+        if display_name is None:
+            if not field_manager.has_custom_names() and field_id in BUILTIN_DISPLAY_NAMES:
+                display_name = BUILTIN_DISPLAY_NAMES[field_id]
+            else:
+                display_name = field_manager.get_display_name(field_id)
+            self._id_to_display_cache[field_id] = display_name
+        return display_name
 
     def _connect_entry_to_stringvar(self, entry_widget, string_var):
         """Manually connect Entry widget to StringVar while preserving placeholder text"""
@@ -47,23 +168,45 @@ class ExcelFieldManager:
         if initial_value:
             entry_widget.insert(0, initial_value)
 
-        # Bind Entry changes to update StringVar
-        def on_entry_change(*args):
-            string_var.set(entry_widget.get())
-
-        # Bind StringVar changes to update Entry
-        def on_var_change(*args):
-            current_entry_value = entry_widget.get()
-            new_var_value = string_var.get()
-            if current_entry_value != new_var_value:
-                entry_widget.delete(0, 'end')
-                if new_var_value:  # Only insert if not empty (preserve placeholder)
-                    entry_widget.insert(0, new_var_value)
+        # All connected StringVars share one trace dispatcher, keyed by the Tcl variable name
+        var_name = str(string_var)
+        self._connected_entries[var_name] = (entry_widget, string_var)
 
         # Bind events
-        entry_widget.bind('<KeyRelease>', on_entry_change)
-        entry_widget.bind('<FocusOut>', on_entry_change)
-        string_var.trace_add('write', on_var_change)
+        entry_change = partial(self._on_connected_entry_change, var_name)
+        entry_widget.bind('<KeyRelease>', entry_change)
+        entry_widget.bind('<FocusOut>', entry_change)
+        string_var.trace_add('write', self._on_connected_var_write)
+
+    def _on_connected_entry_change(self, var_name, event=None):
+        """Push a manually connected Entry's text into its StringVar"""
+        connection = self._connected_entries.get(var_name)
+        if connection is None:
+            return
+        entry_widget, string_var = connection
+        entry_value = entry_widget.get()
+        if entry_value == string_var.get():
+            return  # Nothing changed (navigation keys, focus out) - don't fire the trace
+        # Mark the variable so the write trace doesn't echo the value back into the Entry
+        self._syncing_vars.add(var_name)
+        try:
+            string_var.set(entry_value)
+        finally:
+            self._syncing_vars.discard(var_name)
+
+    def _on_connected_var_write(self, var_name, index, mode):
+        """Shared StringVar write trace: mirror programmatic set() calls into the connected Entry"""
+        if var_name in self._syncing_vars:
+            return
+        connection = self._connected_entries.get(var_name)
+        if connection is None:
+            return
+        entry_widget, string_var = connection
+        new_var_value = string_var.get()
+        if entry_widget.get() != new_var_value:
+            entry_widget.delete(0, 'end')
+            if new_var_value:  # Only insert if not empty (preserve placeholder)
+                entry_widget.insert(0, new_var_value)
 
     def _setup_date_field_focus(self, entry_widget, field_name):
         """Setup enhanced focus behavior for date fields with click-to-clear"""
@@ -82,6 +225,13 @@ class ExcelFieldManager:
 
         entry_widget.bind('<Button-1>', on_click, add='+')
 
+    def _on_text_field_focus_in(self, text_widget, field_id):
+        """Activate the shared toolbar for a text field, binding its formatting shortcuts the first time"""
+        if not getattr(text_widget, '_djs_shortcuts_bound', False):
+            self.parent.bind_formatting_shortcuts(text_widget)
+            text_widget._djs_shortcuts_bound = True
+        self.parent._on_formatting_widget_focus_in(text_widget, field_id)
+
     def _on_date_focus_in(self, entry_widget):
         """Enhanced focus in behavior for date fields"""
         entry_widget.configure(border_color="#2196F3", border_width=2)
@@ -132,30 +282,21 @@ class ExcelFieldManager:
     def serialize_text_widget_formatting(self, text_widget) -> List[Dict[str, Any]]:
         """Serialize tkinter Text widget formatting to JSON-compatible format"""
         try:
-            # Get all text content
-            text_content = text_widget.get("1.0", "end-1c")
-            if not text_content:
-                return []
+            # Single Tcl call returning (kind, tag, index) transitions; indices are already "line.char"
+            transitions = text_widget.dump("1.0", "end", tag=True)
 
-            # Get all tag ranges in the widget
             tag_ranges = []
-            available_tags = ['bold', 'red', 'blue', 'green', 'black']
-
-            for tag in available_tags:
-                ranges = text_widget.tag_ranges(tag)
-                # tag_ranges returns pairs: (start1, end1, start2, end2, ...)
-                for i in range(0, len(ranges), 2):
-                    start_idx = ranges[i]
-                    end_idx = ranges[i + 1]
-
-                    # Convert tkinter indices to character positions
-                    start_pos = text_widget.index(start_idx)
-                    end_pos = text_widget.index(end_idx)
-
+            open_tags = {}
+            for kind, tag, index in transitions:
+                if tag not in _FORMATTING_TAGS:
+                    continue
+                if kind == 'tagon':
+                    open_tags[tag] = index
+                elif kind == 'tagoff' and tag in open_tags:
                     tag_ranges.append({
                         'tag': tag,
-                        'start': start_pos,
-                        'end': end_pos
+                        'start': open_tags.pop(tag),
+                        'end': index
                     })
 
             return tag_ranges
@@ -192,35 +333,39 @@ class ExcelFieldManager:
             locked_contents = {}
             locked_formats = {}
 
-            # Collect lock states
+            # Collect lock states, plus contents and formatting for locked fields, in one pass
             for field_name, lock_var in self.parent.lock_vars.items():
-                locked_states[field_name] = lock_var.get()
-
-            # Collect field contents and formatting for locked fields
-            for field_name in self.parent.lock_vars.keys():
-                if locked_states.get(field_name, False):  # Only collect if locked
-                    if field_name in self.parent.excel_vars:
-                        var = self.parent.excel_vars[field_name]
-
-                        # Handle different widget types
-                        if hasattr(var, 'get') and hasattr(var, 'delete'):  # Text widget
-                            content = var.get("1.0", "end-1c")  # Get all text except final newline
-
-                            # Collect rich text formatting for text fields
-                            field_id = self._get_field_id_from_display_name(field_name)
-                            if field_id in self.text_field_ids and content.strip():
-                                format_data = self.serialize_text_widget_formatting(var)
-                                if format_data:
-                                    locked_formats[field_name] = format_data
-                                    logger.debug(f"Collected {len(format_data)} format tags for {field_name}")
-
-                        elif hasattr(var, 'get'):  # StringVar or Entry
-                            content = var.get()
-                        else:
-                            content = ""
-
-                        if content.strip():  # Only save non-empty content
-                            locked_contents[field_name] = content
+                is_locked = lock_var.get()
+                locked_states[field_name] = is_locked
+                if not is_locked:  # Only collect if locked
+                    continue
+                var = self.parent.excel_vars.get(field_name)
+                if var is None:
+                    continue
+
+                # Handle different widget types
+                if hasattr(var, 'get') and hasattr(var, 'delete'):  # Text widget
+                    # Empty widget - skip without copying the body across the Tcl bridge
+                    if var.compare("end-1c", "==", "1.0"):
+                        continue
+                    content = var.get("1.0", "end-1c")  # Get all text except final newline
+
+                    # Collect rich text formatting for text fields
+                    field_id = self._get_field_id_from_display_name(field_name)
+                    if field_id in self.text_field_ids and not content.isspace():
+                        format_data = self.serialize_text_widget_formatting(var)
+                        if format_data:
+                            locked_formats[field_name] = format_data
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"Collected {len(format_data)} format tags for {field_name}")
+
+                elif hasattr(var, 'get'):  # StringVar or Entry
+                    content = var.get()
+                else:
+                    content = ""
+
+                if content and not content.isspace():  # Only save non-empty content
+                    locked_contents[field_name] = content
 
             logger.info(f"Collected {len(locked_contents)} locked fields with content")
             logger.info(f"Collected {len(locked_formats)} fields with rich text formatting")
@@ -240,19 +385,29 @@ class ExcelFieldManager:
                 logger.info("No saved locked fields to restore")
                 return
 
-            # Restore lock states
-            for field_name, is_locked in locked_states.items():
-                if field_name in self.parent.lock_vars:
-                    self.parent.lock_vars[field_name].set(is_locked)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Restore lock states for fields that exist in the current layout
+            restorable = locked_states.keys() & self.parent.lock_vars.keys()
+            for field_name in restorable:
+                is_locked = locked_states[field_name]
+                self.parent.lock_vars[field_name].set(is_locked)
+                if debug_enabled:
                     logger.debug(f"Restored lock state for {field_name}: {is_locked}")
 
             # Restore field contents for locked fields
-            for field_name, content in locked_contents.items():
-                if field_name in self.parent.excel_vars and locked_states.get(field_name, False):
+            for field_name in locked_contents.keys() & self.parent.excel_vars.keys():
+                if locked_states.get(field_name, False):
+                    content = locked_contents[field_name]
                     var = self.parent.excel_vars[field_name]
 
+                    kind = self._widget_kind_cache.get(field_name)
+                    if kind is None:
+                        kind = 'text' if hasattr(var, 'delete') and hasattr(var, 'insert') else 'stringvar'
+                        self._widget_kind_cache[field_name] = kind
+
                     # Handle different widget types
-                    if hasattr(var, 'delete') and hasattr(var, 'insert'):  # Text widget
+                    if kind == 'text':  # Text widget
                         var.delete("1.0", tk.END)
                         var.insert("1.0", content)
 
@@ -261,12 +416,14 @@ class ExcelFieldManager:
                         if field_id in self.text_field_ids and field_name in locked_formats:
                             format_data = locked_formats[field_name]
                             self.restore_text_widget_formatting(var, format_data)
-                            logger.debug(f"Restored {len(format_data)} format tags for {field_name}")
+                            if debug_enabled:
+                                logger.debug(f"Restored {len(format_data)} format tags for {field_name}")
 
-                    elif hasattr(var, 'set'):  # StringVar
+                    else:  # StringVar
                         var.set(content)
 
-                    logger.debug(f"Restored content for locked field {field_name}: {content[:50]}...")
+                    if debug_enabled:
+                        logger.debug(f"Restored content for locked field {field_name}: {content[:50]}...")
 
             logger.info(f"Restored {len(locked_states)} lock states and {len(locked_contents)} field contents")
             if locked_formats:
@@ -333,35 +490,59 @@ class ExcelFieldManager:
         # Clear existing fields
         for widget in self.parent.excel_fields_frame.winfo_children():
             widget.destroy()
-
+        self._widget_kind_cache.clear()
+        self._connected_entries.clear()
+        self._display_to_id_cache.clear()
+        self._id_to_display_cache.clear()
+
+        # The finished tree is mapped once at the end so Tk does a single layout pass instead of one per widget
+        with self._geometry_batch(self.parent.excel_fields_frame):
+            self._build_excel_fields()
+
+    @contextmanager
+    def _geometry_batch(self, frame):
+        """Freeze pack/grid propagation on frame while building, then flush layout once"""
+        frame.pack_propagate(False)
+        frame.grid_propagate(False)
+        try:
+            yield frame
+        finally:
+            frame.pack_propagate(True)
+            frame.grid_propagate(True)
+            frame.update_idletasks()
+
+    def _build_excel_fields(self):
+        """Build the toolbar and three field columns (called from create_excel_fields)"""
         # Get ALL fields from field manager - we now show all fields, just disabled
-        from core.field_definitions import FIELD_ORDER
         all_field_ids = FIELD_ORDER
-        disabled_field_ids = field_state_manager.get_disabled_fields()
-        enabled_field_ids = [f for f in all_field_ids if f not in disabled_field_ids]
+        self._disabled_set = field_state_manager.get_disabled_field_set()
+        disabled_field_ids = sorted(self._disabled_set)
+        self._pending_style_ops.clear()
+        self._pending_row_weights.clear()
+        enabled_field_ids = [f for f in all_field_ids if f not in self._disabled_set]
 
         logger.info(f"Creating Excel fields for {len(all_field_ids)} total fields")
         logger.info(f"Disabled fields: {disabled_field_ids}")
         logger.info(f"Enabled fields: {enabled_field_ids}")
 
+        # Resolve every display name once for this build
+        id_to_display = {field_id: self._get_display_name(field_id) for field_id in all_field_ids}
+
         # Clear and recreate excel_vars for ALL columns
         self.parent.excel_vars.clear()
+        self.parent._text_fields.clear()
         for field_id in all_field_ids:
-            display_name = field_manager.get_display_name(field_id)
             # Don't create variables for automatically calculated fields
             if field_id != 'dag':
-                self.parent.excel_vars[display_name] = tk.StringVar()
+                self.parent.excel_vars[id_to_display[field_id]] = tk.StringVar()
 
         # Auto-fill today's date in "Inlagd" field
-        inlagd_display_name = field_manager.get_display_name('inlagd')
+        inlagd_display_name = id_to_display['inlagd']
         if inlagd_display_name in self.parent.excel_vars:
-            from datetime import datetime
-            today_date = datetime.now().strftime('%Y-%m-%d')
-            self.parent.excel_vars[inlagd_display_name].set(today_date)
+            self.parent.excel_vars[inlagd_display_name].set(date.today().isoformat())
 
         # Shared formatting toolbar centered above columns 2-3 (Händelse + Notes)
         toolbar_container = ctk.CTkFrame(self.parent.excel_fields_frame, fg_color="transparent")
-        toolbar_container.pack(fill="x", pady=(3, 0))
         toolbar_container.grid_columnconfigure(0, weight=30, minsize=150)  # Left column spacer
         toolbar_container.grid_columnconfigure(1, weight=70)  # Händelse + Notes area
 
@@ -374,35 +555,39 @@ class ExcelFieldManager:
         self.parent.create_shared_formatting_toolbar(toolbar_frame)
 
         # Create resizable PanedWindow for Excel fields
+        # Containers are packed after all children exist (see end of method)
         fields_container = tk.PanedWindow(self.parent.excel_fields_frame, orient="horizontal")
-        fields_container.pack(fill="both", expand=True, pady=(5, 0))
 
         # Define column groupings using field manager to get current display names
         # Get field IDs for each column and convert to display names
-        logger.debug(f"field_manager custom names at UI creation: {field_manager.get_custom_names()}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"field_manager custom names at UI creation: {field_manager.get_custom_names()}")
 
-        column1_field_ids = field_manager.get_fields_by_column('column1')
+        column1_field_ids = COLUMN_MEMBERSHIP.get('column1', frozenset())
         # Include ALL fields in the column, both enabled and disabled
-        column1_fields = [field_manager.get_display_name(field_id) for field_id in all_field_ids
+        column1_fields = [id_to_display[field_id] for field_id in all_field_ids
                          if field_id in column1_field_ids]
-        logger.debug(f"Column1 field IDs: {column1_field_ids}")
-        logger.debug(f"Column1 display names (all): {column1_fields}")
+        if debug_enabled:
+            logger.debug(f"Column1 field IDs: {column1_field_ids}")
+            logger.debug(f"Column1 display names (all): {column1_fields}")
 
-        column3_field_ids = field_manager.get_fields_by_column('column3')
+        column3_field_ids = COLUMN_MEMBERSHIP.get('column3', frozenset())
         # Include ALL fields in the column, both enabled and disabled
-        column3_fields = [field_manager.get_display_name(field_id) for field_id in all_field_ids
+        column3_fields = [id_to_display[field_id] for field_id in all_field_ids
                          if field_id in column3_field_ids]
-        logger.debug(f"Column3 field IDs: {column3_field_ids}")
-        logger.debug(f"Column3 display names (all): {column3_fields}")
+        if debug_enabled:
+            logger.debug(f"Column3 field IDs: {column3_field_ids}")
+            logger.debug(f"Column3 display names (all): {column3_fields}")
 
         # Create Column 1 (Left)
         col1_frame = ctk.CTkFrame(fields_container)
         col1_frame.grid_columnconfigure(0, weight=0)  # Field labels - fixed width
         col1_frame.grid_columnconfigure(1, weight=1)  # Entry fields - expand to fill space
         col1_frame.grid_columnconfigure(2, weight=0)  # Lock switches - fixed width
-        # Configure rows to expand and use available vertical space
-        for i in range(len(column1_fields)):
-            col1_frame.grid_rowconfigure(i, weight=1)
+        # Configure rows to expand and use available vertical space (Tk accepts a list of rows)
+        if column1_fields:
+            col1_frame.grid_rowconfigure(tuple(range(len(column1_fields))), weight=1)
 
         row = 0
         for col_name in column1_fields:
@@ -418,7 +603,7 @@ class ExcelFieldManager:
         col2_frame.grid_rowconfigure(1, weight=1)  # Text widget row expands to fill available space
 
         # Create Händelse field directly in the column (using current display name)
-        handelse_display_name = field_manager.get_display_name('handelse')
+        handelse_display_name = id_to_display['handelse']
         self.create_field_in_frame(col2_frame, handelse_display_name, 0, column_type="column2")
 
         # Add operations box under Händelse field
@@ -439,60 +624,57 @@ class ExcelFieldManager:
         # Add Column 3 to PanedWindow
         fields_container.add(col3_frame, minsize=200)  # Minimum width for Note fields
 
+        # Give text widget rows their expand weight with one rowconfigure per column frame
+        for frame, rows in self._pending_row_weights.items():
+            frame.grid_rowconfigure(tuple(rows), weight=1)
+        self._pending_row_weights.clear()
+
+        # Style disabled fields in one batch while the tree is still unmapped
+        for field_widgets, field_id, is_field_disabled in self._pending_style_ops:
+            apply_field_state(field_widgets, field_id, is_field_disabled)
+        self._pending_style_ops.clear()
+
+        # Map the fully built tree in one go
+        toolbar_container.pack(fill="x", pady=(3, 0))
+        fields_container.pack(fill="both", expand=True, pady=(5, 0))
+
         # Store reference to PanedWindow for position saving/restoring
         self.parent.excel_fields_paned_window = fields_container
 
         # Set initial sash positions for 3-column layout
-        # Schedule this for after the window is displayed and has a known width
-        # Use multiple attempts with increasing delays to ensure proper width
-        self.parent.root.after(500, lambda: self._set_initial_sash_positions_with_retry(fields_container, attempt=1))
-
-    def _set_initial_sash_positions_with_retry(self, panedwindow, attempt=1, max_attempts=5):
-        """Set initial sash positions with retry logic for proper width detection"""
-        try:
-            # Get the current width of the panedwindow
-            panedwindow.update_idletasks()
-            total_width = panedwindow.winfo_width()
-            min_required_width = 600  # Minimum reasonable width for 3 columns
-
-            logger.info(f"SASH RETRY {attempt}: Panedwindow width: {total_width} (min required: {min_required_width})")
-
-            if total_width >= min_required_width:
-                # Width is good, proceed with positioning
-                logger.info(f"SASH RETRY {attempt}: Width sufficient, setting positions")
-                self._set_initial_sash_positions(panedwindow)
-            elif attempt < max_attempts:
-                # Width too small, retry with longer delay
-                retry_delay = 300 * attempt  # Increasing delay: 300ms, 600ms, 900ms, etc.
-                logger.info(f"SASH RETRY {attempt}: Width too small ({total_width}), retrying in {retry_delay}ms")
-                self.parent.root.after(retry_delay, lambda: self._set_initial_sash_positions_with_retry(panedwindow, attempt + 1, max_attempts))
-            else:
-                # All attempts failed, use whatever width we have
-                logger.warning(f"SASH RETRY {attempt}: All attempts failed, using width {total_width}")
-                self._set_initial_sash_positions(panedwindow)
+        # One-shot <Configure> binding: fires as soon as the PanedWindow has been laid out
+        # at a usable width, instead of polling with increasing delays
+        def on_first_configure(event, panedwindow=fields_container):
+            if event.width >= self.MIN_SASH_LAYOUT_WIDTH:
+                panedwindow.unbind('<Configure>', configure_bind_id)
+                self._set_initial_sash_positions(panedwindow, event.width)
 
-        except Exception as e:
-            logger.error(f"Error in sash positioning retry {attempt}: {e}")
+        configure_bind_id = fields_container.bind('<Configure>', on_first_configure)
 
-    def _set_initial_sash_positions(self, panedwindow):
+    def _set_initial_sash_positions(self, panedwindow, total_width=None):
         """Set initial sash positions - restore saved positions or use default distribution"""
         try:
-            # Get the current width of the panedwindow
-            panedwindow.update_idletasks()
-            total_width = panedwindow.winfo_width()
+            # Only force a geometry pass when the caller doesn't already know the width
+            if total_width is None:
+                panedwindow.update_idletasks()
+                total_width = panedwindow.winfo_width()
             num_sashes = 2  # 3 columns = 2 sashes
-            min_reasonable_width = 600  # Minimum width for 3 columns
-            logger.info(f"SASH DEBUG: Panedwindow total width: {total_width} (min reasonable: {min_reasonable_width})")
+            min_reasonable_width = self.MIN_SASH_LAYOUT_WIDTH  # Minimum width for 3 columns
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug(f"SASH DEBUG: Panedwindow total width: {total_width} (min reasonable: {min_reasonable_width})")
 
             if total_width >= min_reasonable_width:
                 # Try to restore saved sash positions
                 saved_positions = self.parent.config.get('excel_sash_positions', None)
-                logger.info(f"SASH DEBUG: Saved positions from config: {saved_positions}")
+                if debug_enabled:
+                    logger.debug(f"SASH DEBUG: Saved positions from config: {saved_positions}")
 
                 if saved_positions and len(saved_positions) == num_sashes:
                     # Restore saved positions (scaled to current width if needed)
                     saved_width = self.parent.config.get('excel_sash_total_width', total_width)
-                    logger.info(f"SASH DEBUG: Saved width: {saved_width}, current width: {total_width}")
+                    if debug_enabled:
+                        logger.debug(f"SASH DEBUG: Saved width: {saved_width}, current width: {total_width}")
                     if saved_width > 0:
                         scale_factor = total_width / saved_width
                         positions = [int(p * scale_factor) for p in saved_positions]
@@ -510,7 +692,7 @@ class ExcelFieldManager:
                     else:
                         self._set_default_sash_positions(panedwindow, total_width)
                 else:
-                    logger.info("SASH DEBUG: No saved positions found, using defaults")
+                    logger.debug("SASH DEBUG: No saved positions found, using defaults")
                     self._set_default_sash_positions(panedwindow, total_width)
             else:
                 logger.warning(f"SASH DEBUG: Total width too small ({total_width} < {min_reasonable_width}), skipping")
@@ -553,248 +735,230 @@ class ExcelFieldManager:
         field_id = self._get_field_id_from_display_name(col_name)
 
         # Check if this field is disabled
-        is_field_disabled = field_state_manager.is_field_disabled(field_id)
-        logger.debug(f"Field '{col_name}' (field_id: {field_id}) is_disabled: {is_field_disabled}")
-
-        # Check if this field should have a lock switch (all except Dag and Inlagd)
-        has_lock = col_name in self.parent.lock_vars
-        logger.debug(f"Creating field '{col_name}' (field_id: {field_id})")
-        logger.debug(f"Available lock_vars keys: {list(self.parent.lock_vars.keys())}")
-        logger.debug(f"Field '{col_name}' has_lock: {has_lock}")
-
-        # Special handling for Dag column - make it read-only with explanation
-        if field_id == 'dag':
-            # Standard horizontal layout for Dag field
-            dag_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
-                    font=ctk.CTkFont(size=12))
-            dag_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
-
-            dag_var = tk.StringVar(value="Formel läggs till automatiskt")
+        is_field_disabled = field_id in self._disabled_set
+
+        # Check if this field should have a lock switch (all except Dag and Inlagd); lock_vars
+        # is built from the same LOCKABLE_FIELDS set, so no per-field dict probe is needed
+        has_lock = field_id in LOCKABLE_FIELDS
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Field '{col_name}' (field_id: {field_id}) is_disabled: {is_field_disabled}")
+            logger.debug(f"Creating field '{col_name}' (field_id: {field_id})")
+            logger.debug(f"Available lock_vars keys: {list(self.parent.lock_vars.keys())}")
+            logger.debug(f"Field '{col_name}' has_lock: {has_lock}")
+
+        builder = (self._field_builders.get(field_id)
+                   or self._column_builders.get(column_type, self._create_vertical_field))
+        return builder(parent_frame, col_name, row, field_id, has_lock, is_field_disabled)
+
+    def _create_dag_field(self, parent_frame, col_name, row, field_id, has_lock, is_field_disabled):
+        """Create the read-only Dag field (formula added automatically on save)"""
+        # Standard horizontal layout for Dag field
+        dag_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
+                font=self._font(12))
+        dag_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
+
+        dag_var = tk.StringVar(value="Formel läggs till automatiskt")
+        entry = ctk.CTkEntry(parent_frame,
+                       textvariable=dag_var,
+                       state="readonly",
+                       font=self._font(12, slant='italic'))
+        entry.grid(row=row, column=1, sticky="ew", padx=(5, 10), pady=(0, 5))
+
+        self._queue_disabled_styling(field_id, is_field_disabled, dag_label, entry)
+
+        # Return 1 row used for Dag field
+        return 1
+
+    def _create_inlagd_field(self, parent_frame, col_name, row, field_id, has_lock, is_field_disabled):
+        """Create the read-only Inlagd field (always today's date)"""
+        # Standard horizontal layout for Inlagd field
+        inlagd_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
+                font=self._font(12))
+        inlagd_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
+
+        entry = ctk.CTkEntry(parent_frame, textvariable=self.parent.excel_vars[col_name],
+                       state="readonly",
+                       font=self._font(12))
+        entry.grid(row=row, column=1, sticky="ew", padx=(5, 10), pady=(0, 5))
+
+        self._queue_disabled_styling(field_id, is_field_disabled, inlagd_label, entry)
+
+        # Return 1 row used for Inlagd field
+        return 1
+
+    def _create_text_field(self, parent_frame, col_name, row, field_id, has_lock, is_field_disabled):
+        """Create a rich text field with character counter (Händelse, Note1-3)"""
+        # Row 1: Field name with inline character counter and lock switch (if applicable),
+        # gridded directly into the column frame (label left, switch right)
+        limit = self.parent.handelse_char_limit if field_id == 'handelse' else self.parent.char_limit
+        label_text = f"{col_name}: (0/{limit})"
+        field_label = ctk.CTkLabel(parent_frame, text=label_text, font=self._font(12))
+        field_label.grid(row=row, column=0, sticky="nw", padx=(3, 2), pady=(0, 2))
+        # Store reference for counter updates
+        self.parent.char_counters[col_name] = field_label
+
+        # Add lock switch for text fields that should have one - compact with lock symbol
+        if has_lock:
+            lock_switch = ctk.CTkCheckBox(parent_frame,
+                                       text="🔒",
+                                       width=18,
+                                       variable=self.parent.lock_vars[col_name],
+                                       font=self._font(12))
+            lock_switch.grid(row=row, column=1, sticky="ne", pady=(0, 2))
+
+        # Row 2: Text widget (full width)
+        if field_id == 'handelse':
+            height = 22  # Match combined height of Note1-3 (8+8+6=22)
+        elif field_id in ['note1', 'note2']:
+            height = 8  # Increased from 6 to make character counters visible
+        else:
+            height = 6  # Increased from 4 (Note3 and other text fields)
+
+        # Create scrollable text widget container
+        scrollable_text = ScrollableText(parent_frame, height=height,
+                                       wrap=tk.WORD, font=('Arial', 9),
+                                       undo=False)
+
+        # Get reference to the actual text widget for bindings
+        text_widget = scrollable_text.text_widget
+
+        # Enable undo functionality for text widget
+        self.parent.enable_undo_for_widget(text_widget)
+
+        # Custom paste binding: Command-v for macOS, Control-v for Windows/Linux
+        # <<Paste>> is disabled since our handlers cover both platforms
+        text_widget.bind('<Command-v>', lambda e: self.parent.handle_paste_undo(text_widget))
+        text_widget.bind('<Control-v>', lambda e: self.parent.handle_paste_undo(text_widget))
+        text_widget.bind('<<Paste>>', lambda e: 'break')  # Disable built-in paste
+
+        # Bind character count checking
+        text_widget.bind('<KeyRelease>', self._field_handler('char_count', col_name))
+        text_widget.bind('<Button-1>', self._field_handler('char_count_deferred', col_name))
+
+        # Undo handling for key presses (debounced snapshots)
+        text_widget.bind('<KeyPress>',
+                       lambda e: self.parent.handle_text_key_press_undo(e))
+
+        # Configure formatting tags for rich text
+        self.parent.setup_text_formatting_tags(text_widget)
+
+        # Register for shared formatting toolbar; keyboard shortcuts are bound on first focus
+        self.parent._formatting_text_widgets.add(text_widget)
+        text_widget.bind('<FocusIn>',
+            lambda e, tw=text_widget, fid=field_id: self._on_text_field_focus_in(tw, fid),
+            add='+')
+        text_widget.bind('<FocusOut>',
+            lambda e: self.parent._on_formatting_widget_focus_out(),
+            add='+')
+
+        # Place scrollable text container directly after header (no per-field toolbar)
+        if field_id == 'handelse':
+            scrollable_text.grid(row=row+1, column=0, columnspan=2, sticky="new", padx=(3, 3), pady=(0, 1))
+            self._pending_row_weights.setdefault(parent_frame, []).append(row+1)
+        else:
+            scrollable_text.grid(row=row+1, column=0, columnspan=2, sticky="ew", padx=(3, 3), pady=(0, 1))
+            if field_id in ['note1', 'note2', 'note3']:
+                self._pending_row_weights.setdefault(parent_frame, []).append(row+1)
+
+        # Store reference to scrollable text container (delegation will handle method calls)
+        self.parent.excel_vars[col_name] = scrollable_text
+        self.parent._text_fields.add(col_name)
+
+        self._queue_disabled_styling(field_id, is_field_disabled, field_label, text_widget,
+                                     lock_switch if has_lock else None)
+
+        # Return the number of rows used (2 rows: header + text widget)
+        return 2
+
+    def _create_horizontal_field(self, parent_frame, col_name, row, field_id, has_lock, is_field_disabled):
+        """Create a single-row entry field (column 1)"""
+        # Horizontal layout for column 1 and date fields in column 2 - saves vertical space
+        field_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
+                font=self._font(12))
+        field_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
+
+        # Set appropriate width based on field type - reduced height
+        if field_id in ['startdatum', 'slutdatum']:
+            # Date fields: 2025-07-25 (10 chars + padding) with placeholder
             entry = ctk.CTkEntry(parent_frame,
-                           textvariable=dag_var,
-                           state="readonly",
-                           font=ctk.CTkFont(size=12, slant='italic'))
-            entry.grid(row=row, column=1, sticky="ew", padx=(5, 10), pady=(0, 5))
-
-            # Apply disabled styling if field is disabled
-            if is_field_disabled:
-                field_widgets = {'label': dag_label, 'input': entry}
-                apply_field_state(field_widgets, field_id, is_field_disabled)
-
-            # Return 1 row used for Dag field
-            return 1
-
-        # Special handling for Inlagd - read-only, always today's date
-        elif field_id == 'inlagd':
-            # Standard horizontal layout for Inlagd field
-            inlagd_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
-                    font=ctk.CTkFont(size=12))
-            inlagd_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
-
-            entry = ctk.CTkEntry(parent_frame, textvariable=self.parent.excel_vars[col_name],
-                           state="readonly",
-                           font=ctk.CTkFont(size=12))
-            entry.grid(row=row, column=1, sticky="ew", padx=(5, 10), pady=(0, 5))
-
-            # Apply disabled styling if field is disabled
-            if is_field_disabled:
-                field_widgets = {'label': inlagd_label, 'input': entry}
-                apply_field_state(field_widgets, field_id, is_field_disabled)
-
-            # Return 1 row used for Inlagd field
-            return 1
-
-        # Special vertical layout for text fields with character counters (Händelse, Note1-3)
-        elif self._is_text_field(field_id):
-            # Row 1: Field name with inline character counter and lock switch (if applicable)
-            header_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
-            header_frame.grid(row=row, column=0, columnspan=2, sticky="new", pady=(0, 2))
-
-            # Create label with inline character counter
-            limit = self.parent.handelse_char_limit if field_id == 'handelse' else self.parent.char_limit
-            label_text = f"{col_name}: (0/{limit})"
-            field_label = ctk.CTkLabel(header_frame, text=label_text, font=ctk.CTkFont(size=12))
-            field_label.pack(side="left", padx=(3, 2))
-            # Store reference for counter updates
-            self.parent.char_counters[col_name] = field_label
-
-            # Add lock switch for text fields that should have one - compact with lock symbol
-            if has_lock:
-                lock_switch = ctk.CTkCheckBox(header_frame,
-                                           text="🔒",
-                                           width=18,
-                                           variable=self.parent.lock_vars[col_name],
-                                           font=ctk.CTkFont(size=12))
-                lock_switch.pack(side="right")
-
-            # Row 2: Text widget (full width)
-            if field_id == 'handelse':
-                height = 22  # Match combined height of Note1-3 (8+8+6=22)
-            elif field_id in ['note1', 'note2']:
-                height = 8  # Increased from 6 to make character counters visible
-            else:
-                height = 6  # Increased from 4 (Note3 and other text fields)
-
-            # Create scrollable text widget container
-            scrollable_text = ScrollableText(parent_frame, height=height,
-                                           wrap=tk.WORD, font=('Arial', 9),
-                                           undo=False)
-
-            # Get reference to the actual text widget for bindings
-            text_widget = scrollable_text.text_widget
-
-            # Enable undo functionality for text widget
-            self.parent.enable_undo_for_widget(text_widget)
-
-            # Custom paste binding: Command-v for macOS, Control-v for Windows/Linux
-            # <<Paste>> is disabled since our handlers cover both platforms
-            text_widget.bind('<Command-v>', lambda e: self.parent.handle_paste_undo(text_widget))
-            text_widget.bind('<Control-v>', lambda e: self.parent.handle_paste_undo(text_widget))
-            text_widget.bind('<<Paste>>', lambda e: 'break')  # Disable built-in paste
-
-            # Bind character count checking
-            text_widget.bind('<KeyRelease>',
-                           lambda e, col=col_name: self.parent.check_character_count(e, col))
-            text_widget.bind('<Button-1>',
-                           lambda e, col=col_name: self.parent.root.after(1, lambda: self.parent.check_character_count(e, col)))
-
-            # Undo handling for key presses (debounced snapshots)
-            text_widget.bind('<KeyPress>',
-                           lambda e: self.parent.handle_text_key_press_undo(e))
-
-            # Configure formatting tags for rich text
-            self.parent.setup_text_formatting_tags(text_widget)
-
-            # Register for shared formatting toolbar and bind keyboard shortcuts
-            self.parent._formatting_text_widgets.add(text_widget)
-            text_widget.bind('<FocusIn>',
-                lambda e, tw=text_widget, fid=field_id: self.parent._on_formatting_widget_focus_in(tw, fid),
-                add='+')
-            text_widget.bind('<FocusOut>',
-                lambda e: self.parent._on_formatting_widget_focus_out(),
-                add='+')
-            self.parent.bind_formatting_shortcuts(text_widget)
-
-            # Place scrollable text container directly after header (no per-field toolbar)
-            if field_id == 'handelse':
-                scrollable_text.grid(row=row+1, column=0, columnspan=2, sticky="new", padx=(3, 3), pady=(0, 1))
-                parent_frame.grid_rowconfigure(row+1, weight=1)
-            else:
-                scrollable_text.grid(row=row+1, column=0, columnspan=2, sticky="ew", padx=(3, 3), pady=(0, 1))
-                if field_id in ['note1', 'note2', 'note3']:
-                    parent_frame.grid_rowconfigure(row+1, weight=1)
-
-            # Store reference to scrollable text container (delegation will handle method calls)
-            self.parent.excel_vars[col_name] = scrollable_text
-
-            # Apply disabled styling if field is disabled
-            if is_field_disabled:
-                field_widgets = {'label': field_label, 'input': text_widget}
-                if has_lock:
-                    field_widgets['checkbox'] = lock_switch
-                apply_field_state(field_widgets, field_id, is_field_disabled)
-
-            # Return the number of rows used (2 rows: header + text widget)
-            return 2
-
-        # Layout depends on column type and field type
-        elif column_type == "column1":
-            # Horizontal layout for column 1 and date fields in column 2 - saves vertical space
-            field_label = ctk.CTkLabel(parent_frame, text=f"{col_name}:",
-                    font=ctk.CTkFont(size=12))
-            field_label.grid(row=row, column=0, sticky="w", padx=(3, 2), pady=(0, 1))
-
-            # Set appropriate width based on field type - reduced height
-            if field_id in ['startdatum', 'slutdatum']:
-                # Date fields: 2025-07-25 (10 chars + padding) with placeholder
-                entry = ctk.CTkEntry(parent_frame,
-                               font=ctk.CTkFont(size=11), width=120, height=22,
-                               placeholder_text="YYYY-MM-DD")
-                entry.grid(row=row, column=1, sticky="w", padx=(2, 3), pady=(0, 1))
-                # Manual connection to StringVar while preserving placeholder
-                self._connect_entry_to_stringvar(entry, self.parent.excel_vars[col_name])
-            elif field_id in ['starttid', 'sluttid']:
-                # Time fields: 18:45 (5 chars + padding) with placeholder
-                entry = ctk.CTkEntry(parent_frame,
-                               font=ctk.CTkFont(size=11), width=80, height=22,
-                               placeholder_text="HH:MM")
-                entry.grid(row=row, column=1, sticky="w", padx=(2, 3), pady=(0, 1))
-                # Manual connection to StringVar while preserving placeholder
-                self._connect_entry_to_stringvar(entry, self.parent.excel_vars[col_name])
-            else:
-                # Other fields: expand to fill available space with enhanced focus styling
-                entry = ctk.CTkEntry(parent_frame, textvariable=self.parent.excel_vars[col_name],
-                               font=ctk.CTkFont(size=11), height=22,
-                               border_color="#E0E0E0", border_width=1, fg_color="#F8F8F8")
-                entry.grid(row=row, column=1, sticky="ew", padx=(2, 3), pady=(0, 1))
-
-            # Enable undo tracking for Entry widget
-            self.parent.enable_undo_for_widget(entry)
-
-            # Add enhanced focus behavior for left column fields (excluding date/time fields)
-            if col_name not in ['Startdatum', 'Slutdatum', 'Starttid', 'Sluttid']:
-                self._setup_left_column_field_focus(entry, col_name)
-
-            # Note: Time field validation removed to match date field behavior
-            # Time validation will still occur during save operations
-
-            # Add lock switch for fields that should have one (in column 2) - compact with lock symbol
-            lock_switch = None
-            if has_lock:
-                lock_switch = ctk.CTkCheckBox(parent_frame,
-                                           text="🔒",
-                                           width=18,
-                                           variable=self.parent.lock_vars[col_name],
-                                           font=ctk.CTkFont(size=12))
-                lock_switch.grid(row=row, column=2, sticky="w", padx=(2, 3), pady=(0, 1))
-
-            # Apply disabled styling if field is disabled
-            if is_field_disabled:
-                field_widgets = {'label': field_label, 'input': entry}
-                if lock_switch:
-                    field_widgets['checkbox'] = lock_switch
-                apply_field_state(field_widgets, field_id, is_field_disabled)
-
-            # Return 1 row used for horizontal layout
-            return 1
-
+                           font=self._font(11), width=120, height=22,
+                           placeholder_text="YYYY-MM-DD")
+            entry.grid(row=row, column=1, sticky="w", padx=(2, 3), pady=(0, 1))
+            # Manual connection to StringVar while preserving placeholder
+            self._connect_entry_to_stringvar(entry, self.parent.excel_vars[col_name])
+        elif field_id in ['starttid', 'sluttid']:
+            # Time fields: 18:45 (5 chars + padding) with placeholder
+            entry = ctk.CTkEntry(parent_frame,
+                           font=self._font(11), width=80, height=22,
+                           placeholder_text="HH:MM")
+            entry.grid(row=row, column=1, sticky="w", padx=(2, 3), pady=(0, 1))
+            # Manual connection to StringVar while preserving placeholder
+            self._connect_entry_to_stringvar(entry, self.parent.excel_vars[col_name])
         else:
-            # Vertical layout for columns 2&3 - maximizes input field width
-            # Row 1: Field name and lock switch
-            header_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
-            header_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 2))
-
-            field_label = ctk.CTkLabel(header_frame, text=f"{col_name}:",
-                    font=ctk.CTkFont(size=12))
-            field_label.pack(side="left", padx=(3, 2))
-
-            # Add lock switch for fields that should have one - compact with lock symbol
-            lock_switch = None
-            if has_lock:
-                lock_switch = ctk.CTkCheckBox(header_frame,
-                                           text="🔒",
-                                           width=18,
-                                           variable=self.parent.lock_vars[col_name],
-                                           font=ctk.CTkFont(size=12))
-                lock_switch.pack(side="right")
-
-            # Row 2: Entry field (full width)
+            # Other fields: expand to fill available space with enhanced focus styling
             entry = ctk.CTkEntry(parent_frame, textvariable=self.parent.excel_vars[col_name],
-                           font=ctk.CTkFont(size=12))
-            entry.grid(row=row+1, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+                           font=self._font(11), height=22,
+                           border_color="#E0E0E0", border_width=1, fg_color="#F8F8F8")
+            entry.grid(row=row, column=1, sticky="ew", padx=(2, 3), pady=(0, 1))
+
+        # Enable undo tracking for Entry widget
+        self.parent.enable_undo_for_widget(entry)
 
-            # Enable undo tracking for Entry widget
-            self.parent.enable_undo_for_widget(entry)
+        # Add enhanced focus behavior for left column fields (excluding date/time fields)
+        if col_name not in ['Startdatum', 'Slutdatum', 'Starttid', 'Sluttid']:
+            self._setup_left_column_field_focus(entry, col_name)
+
+        # Note: Time field validation removed to match date field behavior
+        # Time validation will still occur during save operations
+
+        # Add lock switch for fields that should have one (in column 2) - compact with lock symbol
+        lock_switch = None
+        if has_lock:
+            lock_switch = ctk.CTkCheckBox(parent_frame,
+                                       text="🔒",
+                                       width=18,
+                                       variable=self.parent.lock_vars[col_name],
+                                       font=self._font(12))
+            lock_switch.grid(row=row, column=2, sticky="w", padx=(2, 3), pady=(0, 1))
+
+        self._queue_disabled_styling(field_id, is_field_disabled, field_label, entry, lock_switch)
+
+        # Return 1 row used for horizontal layout
+        return 1
+
+    def _create_vertical_field(self, parent_frame, col_name, row, field_id, has_lock, is_field_disabled):
+        """Create a two-row entry field (columns 2 and 3)"""
+        # Vertical layout for columns 2&3 - maximizes input field width
+        # Row 1: Field name and lock switch
+        header_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
+        header_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 2))
+
+        field_label = ctk.CTkLabel(header_frame, text=f"{col_name}:",
+                font=self._font(12))
+        field_label.pack(side="left", padx=(3, 2))
+
+        # Add lock switch for fields that should have one - compact with lock symbol
+        lock_switch = None
+        if has_lock:
+            lock_switch = ctk.CTkCheckBox(header_frame,
+                                       text="🔒",
+                                       width=18,
+                                       variable=self.parent.lock_vars[col_name],
+                                       font=self._font(12))
+            lock_switch.pack(side="right")
+
+        # Row 2: Entry field (full width)
+        entry = ctk.CTkEntry(parent_frame, textvariable=self.parent.excel_vars[col_name],
+                       font=self._font(12))
+        entry.grid(row=row+1, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+
+        # Enable undo tracking for Entry widget
+        self.parent.enable_undo_for_widget(entry)
 
-            # Apply disabled styling if field is disabled
-            if is_field_disabled:
-                field_widgets = {'label': field_label, 'input': entry}
-                if lock_switch:
-                    field_widgets['checkbox'] = lock_switch
-                apply_field_state(field_widgets, field_id, is_field_disabled)
+        self._queue_disabled_styling(field_id, is_field_disabled, field_label, entry, lock_switch)
 
-            # Return 2 rows used for vertical layout
-            return 2
+        # Return 2 rows used for vertical layout
+        return 2
 
     def _create_datetime_fields_in_subframe(self, datetime_frame):
         """Create date/time fields in a simple 2x2 grid layout"""
@@ -865,29 +1029,18 @@ class ExcelFieldManager:
         color_frame.pack(expand=True, pady=4)
 
         # Label for color selection - centered
-        color_label = ctk.CTkLabel(color_frame, text="Bakgrundsfärg på nya excel-raden:", font=ctk.CTkFont(size=10, weight="bold"))
+        color_label = ctk.CTkLabel(color_frame, text="Bakgrundsfärg på nya excel-raden:", font=self._font(10, weight="bold"))
         color_label.pack(pady=(0, 3))
 
         # Container for color buttons - centered
         color_buttons_frame = ctk.CTkFrame(color_frame, fg_color="transparent")
         color_buttons_frame.pack()
 
-        # Colored button options - enlarged for better usability
-        color_options = [
-            ("none", "Ingen", "#FFFFFF"),
-            ("yellow", "Gul", "#FFF59D"),
-            ("green", "Grön", "#C8E6C9"),
-            ("blue", "Blå", "#BBDEFB"),
-            ("red", "Röd", "#FFCDD2"),
-            ("pink", "Rosa", "#F8BBD9"),
-            ("gray", "Grå", "#E0E0E0")
-        ]
-
         # Store button references for selection state management
         self.parent.color_buttons = {}
 
-        for value, text, color in color_options:
-            current_selection = self.parent.row_color_var.get() if hasattr(self.parent, 'row_color_var') else "none"
+        current_selection = self.parent.row_color_var.get() if hasattr(self.parent, 'row_color_var') else "none"
+        for value, text, fill_color, hover_color, text_color in ROW_COLOR_TABLE:
             is_selected = current_selection == value
 
             button = ctk.CTkButton(
@@ -895,10 +1048,10 @@ class ExcelFieldManager:
                 text=text,
                 width=45,
                 height=22,  # Enlarged for better touch/click usability
-                font=ctk.CTkFont(size=9),
-                fg_color=color if value != "none" else "#FFFFFF",
-                hover_color=self.parent._get_hover_color(color),
-                text_color="#333333" if value != "none" else "#666666",
+                font=self._font(9),
+                fg_color=fill_color,
+                hover_color=hover_color,
+                text_color=text_color,
                 border_color="#000000" if is_selected else "#666666",
                 border_width=2 if is_selected else 1,
                 command=lambda v=value: self.parent._select_row_color(v)
@@ -921,7 +1074,7 @@ class ExcelFieldManager:
         self.parent.save_all_btn = ctk.CTkButton(buttons_container, text="Spara allt och rensa", width=200, height=40,
                                      command=self.parent.save_all_and_clear,
                                      fg_color="#28a745", hover_color="#218838",
-                                     font=ctk.CTkFont(size=13, weight="bold"))
+                                     font=self._font(13, weight="bold"))
         self.parent.save_all_btn.pack(side="left", padx=(0, 5))
 
         self.parent.new_excel_row_btn = ctk.CTkButton(buttons_container, text="Rensa utan spara", width=180, height=40,
@@ -929,7 +1082,7 @@ class ExcelFieldManager:
                                           fg_color="transparent", hover_color=("gray85", "gray30"),
                                           border_width=2, border_color="#17a2b8",
                                           text_color="#17a2b8",
-                                          font=ctk.CTkFont(size=13, weight="bold"))
+                                          font=self._font(13, weight="bold"))
         self.parent.new_excel_row_btn.pack(side="left", padx=(5, 0))
 
     def refresh_field_styling(self):
@@ -938,7 +1091,6 @@ class ExcelFieldManager:
         This is more efficient than recreating all fields.
         """
         try:
-            from core.field_definitions import FIELD_ORDER
             disabled_field_ids = field_state_manager.get_disabled_fields()
 
             logger.info(f"Refreshing field styling for {len(disabled_field_ids)} disabled fields")
@@ -946,7 +1098,7 @@ class ExcelFieldManager:
             # Iterate through all created fields and update their styling
             for field_id in FIELD_ORDER:
                 is_field_disabled = field_id in disabled_field_ids
-                display_name = field_manager.get_display_name(field_id)
+                display_name = self._get_display_name(field_id)
 
                 # Find the field widgets in parent's attributes
                 # Field entries are stored with display names as keys
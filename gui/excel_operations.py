@@ -6,8 +6,10 @@ CRITICAL: This module contains sensitive hybrid Excel operations that must not b
 """
 
 import logging
-from datetime import datetime
-from pathlib import Path
+import os
+import re
+import time
+from datetime import date
 
 try:
     import tkinter as tk
@@ -15,10 +17,54 @@ try:
 except ImportError:
     pass
 
+try:
+    from openpyxl.cell.rich_text import CellRichText
+except ImportError:
+    CellRichText = ()  # isinstance() against an empty tuple is always False
+
 from core.filename_parser import FilenameParser
 
 logger = logging.getLogger(__name__)
 
+# Accepted date/time input shapes for validate_date_format / validate_time_format
+_RE_YYYY_MM_DD = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+_RE_YY_MM_DD = re.compile(r'^(\d{2})-(\d{1,2})-(\d{1,2})$')
+_RE_YYMMDD = re.compile(r'^(\d{6})$')
+_RE_HHCOLONMM = re.compile(r'^(\d{1,2}):(\d{1,2})$')
+
+# Text columns that commonly receive pasted PDF content and get cleaned before saving
+_PDF_TEXT_COLS = frozenset({'Händelse', 'Note1', 'Note2', 'Note3'})
+
+# Date/time fields checked before saving, and the error dialog wording per kind
+_DT_VALIDATIONS = (('Startdatum', 'date'), ('Slutdatum', 'date'), ('Starttid', 'time'), ('Sluttid', 'time'))
+_DT_ERROR_TEXTS = {
+    'date': ("Ogiltigt datumformat", "datumet"),
+    'time': ("Ogiltigt tidsformat", "tiden"),
+}
+_PRE_SAVE_ERROR_TEMPLATE = (
+    "Fel i fältet '{field_name}':\n\n{error_msg}\n\n"
+    "Nuvarande värde: '{current_value}'\n\n"
+    "Korrigera {noun} och försök igen."
+)
+_FOCUS_OUT_ERROR_TEMPLATE = "Fel i fält '{field_name}': {error_msg}"
+
+# Quiet backoff before asking the user to close a program that locks the Excel file
+_LOCK_SILENT_RETRIES = 3
+_LOCK_RETRY_BASE_DELAY = 0.2
+_LOCK_RETRY_MAX_DELAY = 2.0
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_ymd(year, month, day):
+    """Check that year/month/day form a real calendar date with a four-digit year"""
+    if not 1000 <= year <= 9999 or not 1 <= month <= 12:
+        return False
+    days_in_month = _DAYS_IN_MONTH[month]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month = 29
+    return 1 <= day <= days_in_month
+
 
 class ExcelOperationsMixin:
     """Mixin class providing Excel operations - SENSITIVE: NO MODIFICATIONS"""
@@ -31,20 +77,20 @@ class ExcelOperationsMixin:
         if not self.excel_vars:
             return False
 
-        # Check if both Startdatum and Händelse have content
-        startdatum_content = ""
-        if 'Startdatum' in self.excel_vars and hasattr(self.excel_vars['Startdatum'], 'get'):
-            startdatum_content = self.excel_vars['Startdatum'].get().strip()
-
-        handelse_content = ""
-        if 'Händelse' in self.excel_vars and hasattr(self.excel_vars['Händelse'], 'get'):
-            if hasattr(self.excel_vars['Händelse'], 'delete'):  # Text widget
-                handelse_content = self.excel_vars['Händelse'].get("1.0", tk.END).strip()
-            else:  # StringVar
-                handelse_content = self.excel_vars['Händelse'].get().strip()
+        # Simple rule: Excel row can only be saved if BOTH required fields have content.
+        # Startdatum is checked first so an empty date skips reading the Händelse buffer.
+        startdatum = self.excel_vars.get('Startdatum')
+        if startdatum is None or not startdatum.get().strip():
+            return False
 
-        # Simple rule: Excel row can only be saved if BOTH required fields have content
-        return startdatum_content and handelse_content
+        handelse = self.excel_vars.get('Händelse')
+        if handelse is None:
+            return False
+        if hasattr(handelse, 'delete'):  # Text widget
+            handelse_content = handelse.get("1.0", "end-1c")
+        else:  # StringVar
+            handelse_content = handelse.get()
+        return bool(handelse_content.strip())
 
     def save_excel_row(self) -> bool:
         """Save current Excel data as new row"""
@@ -52,66 +98,74 @@ class ExcelOperationsMixin:
             return False
 
         # Check if Excel file still exists
-        if not self.excel_manager.excel_path or not Path(self.excel_manager.excel_path).exists():
+        excel_path = self.excel_manager.excel_path
+        if not excel_path or not os.path.exists(excel_path):
             messagebox.showerror("Excel-fil saknas",
-                               f"Excel-filen kunde inte hittas:\n{self.excel_manager.excel_path}\n\n" +
+                               f"Excel-filen kunde inte hittas:\n{excel_path}\n\n" +
                                "Filen kan ha flyttats eller tagits bort. Välj Excel-filen igen.")
             return False
 
         excel_data = {}
 
         # Get data from Excel fields
+        text_fields = self._text_fields
         for col_name, var in self.excel_vars.items():
-            if hasattr(var, 'get'):
-                if hasattr(var, 'delete'):  # It's a Text widget
-                    # Extract formatted text for Excel
-                    formatted_text = self.get_formatted_text_for_excel(var)
-
-                    # Clean PDF text for text fields that commonly contain pasted PDF content
-                    if col_name in ['Händelse', 'Note1', 'Note2', 'Note3']:
-                        # If it's a CellRichText object, keep formatting intact
-                        if hasattr(formatted_text, '__class__') and formatted_text.__class__.__name__ == 'CellRichText':
-                            # For RichText, we keep the formatting but clean the plain text fallback
-                            excel_data[col_name] = formatted_text
-                        else:
-                            # Plain text, clean it
-                            excel_data[col_name] = FilenameParser.clean_pdf_text(formatted_text)
-                    else:
+            if col_name in text_fields:  # It's a Text widget
+                # Extract formatted text for Excel
+                formatted_text = self.get_formatted_text_for_excel(var)
+
+                # Clean PDF text for text fields that commonly contain pasted PDF content
+                if col_name in _PDF_TEXT_COLS:
+                    # If it's a CellRichText object, keep formatting intact
+                    if isinstance(formatted_text, CellRichText):
+                        # For RichText, we keep the formatting but clean the plain text fallback
                         excel_data[col_name] = formatted_text
-                else:  # It's a StringVar (Entry widget)
-                    excel_data[col_name] = var.get()
-            else:
-                excel_data[col_name] = ""
+                    else:
+                        # Plain text, clean it
+                        excel_data[col_name] = FilenameParser.clean_pdf_text(formatted_text)
+                else:
+                    excel_data[col_name] = formatted_text
+            else:  # It's a StringVar (Entry widget)
+                excel_data[col_name] = var.get()
 
         # Handle Inlagd - always set today's date (field is read-only)
         if 'Inlagd' in self.excel_vars:
-            excel_data['Inlagd'] = datetime.now().strftime('%Y-%m-%d')
+            excel_data['Inlagd'] = date.today().isoformat()
 
         # Get filename for special handling
+        date_str = self.date_var.get()
         filename = excel_data.get('Källa', '')
         if not filename:
             # Only construct filename if we have actual content from PDF filename components
-            date = self.date_var.get().strip()
+            date_part = date_str.strip()
             newspaper = self.newspaper_var.get().strip()
             comment = self.comment_var.get().strip()
             pages = self.pages_var.get().strip()
 
             # Only create filename if we have at least date or newspaper (indicating PDF was loaded)
-            if date or newspaper:
-                filename = FilenameParser.construct_filename(date, newspaper, comment, pages)
+            if date_part or newspaper:
+                filename = FilenameParser.construct_filename(date_part, newspaper, comment, pages)
             else:
                 filename = ""  # No filename if no PDF components exist
 
         # Add filename components for special handling
-        excel_data['date'] = self.date_var.get()
+        excel_data['date'] = date_str
 
         # Try to save with retry loop for file lock handling
         MAX_RETRIES = 10
         retries = 0
+        silent_retries = 0
         while True:
             try:
                 result = self.excel_manager.add_row_with_xlsxwriter(excel_data, filename, self.row_color_var.get())
             except PermissionError:
+                # Transient locks (antivirus, sync clients, autosave) usually clear within a second,
+                # so back off and retry quietly a few times before bothering the user
+                if silent_retries < _LOCK_SILENT_RETRIES:
+                    time.sleep(min(_LOCK_RETRY_BASE_DELAY * (2 ** silent_retries), _LOCK_RETRY_MAX_DELAY))
+                    silent_retries += 1
+                    logger.info(f"Excel file locked, silent retry {silent_retries}/{_LOCK_SILENT_RETRIES}")
+                    continue
                 retries += 1
                 if retries >= MAX_RETRIES:
                     messagebox.showerror("Fel", "Kunde inte spara till Excel-filen efter flera försök. Kontrollera att filen inte är låst.")
@@ -141,44 +195,27 @@ class ExcelOperationsMixin:
     def validate_all_date_time_fields(self) -> bool:
         """Validate all date and time fields before saving. Returns False if validation fails."""
         try:
-            date_fields = ['Startdatum', 'Slutdatum']
-            time_fields = ['Starttid', 'Sluttid']
-
-            # Validate date fields
-            for field_name in date_fields:
-                if field_name in self.excel_vars:
-                    current_value = self.excel_vars[field_name].get().strip()
-                    if current_value:  # Only validate non-empty fields
-                        is_valid, formatted_date, error_msg = self.validate_date_format(current_value)
-                        if not is_valid:
-                            messagebox.showerror(
-                                "Ogiltigt datumformat",
-                                f"Fel i fältet '{field_name}':\n\n{error_msg}\n\n"
-                                f"Nuvarande värde: '{current_value}'\n\n"
-                                "Korrigera datumet och försök igen."
-                            )
-                            return False
-                        else:
-                            # Update field with validated format
-                            self.excel_vars[field_name].set(formatted_date)
-
-            # Validate time fields
-            for field_name in time_fields:
-                if field_name in self.excel_vars:
-                    current_value = self.excel_vars[field_name].get().strip()
-                    if current_value:  # Only validate non-empty fields
-                        is_valid, formatted_time, error_msg = self.validate_time_format(current_value)
-                        if not is_valid:
-                            messagebox.showerror(
-                                "Ogiltigt tidsformat",
-                                f"Fel i fältet '{field_name}':\n\n{error_msg}\n\n"
-                                f"Nuvarande värde: '{current_value}'\n\n"
-                                "Korrigera tiden och försök igen."
-                            )
-                            return False
-                        else:
-                            # Update field with validated format
-                            self.excel_vars[field_name].set(formatted_time)
+            validators = {'date': self.validate_date_format, 'time': self.validate_time_format}
+
+            for field_name, kind in _DT_VALIDATIONS:
+                var = self.excel_vars.get(field_name)
+                if var is None:
+                    continue
+                raw_value = var.get()
+                current_value = raw_value.strip()
+                if not current_value:  # Only validate non-empty fields
+                    continue
+
+                is_valid, formatted_value, error_msg = validators[kind](current_value)
+                if not is_valid:
+                    title, noun = _DT_ERROR_TEXTS[kind]
+                    self._report_validation_error(title, _PRE_SAVE_ERROR_TEMPLATE, field_name=field_name,
+                                                  error_msg=error_msg, current_value=current_value, noun=noun)
+                    return False
+
+                # Update field with validated format, skipping no-op writes that would fire traces
+                if formatted_value != raw_value:
+                    var.set(formatted_value)
 
             return True  # All validations passed
 
@@ -205,12 +242,12 @@ class ExcelOperationsMixin:
     def check_character_count(self, event, column_name):
         """Check character count in text fields and update counter with color coding"""
         text_widget = event.widget
-        content = text_widget.get("1.0", tk.END)
-        # Remove the trailing newline that tk.Text always adds
-        if content.endswith('\n'):
-            content = content[:-1]
-
-        char_count = len(content)
+        # Let Tk count the characters (excluding the trailing newline tk.Text always adds)
+        # instead of copying the whole buffer into Python on every keystroke
+        counted = text_widget.count("1.0", "end-1c", "chars")
+        if isinstance(counted, tuple):
+            counted = counted[0]
+        char_count = counted or 0
         limit = self.handelse_char_limit if column_name == 'Händelse' else self.char_limit
 
         # Update counter display (now inline with field label)
@@ -222,10 +259,8 @@ class ExcelOperationsMixin:
 
         # Hard limit enforcement
         if char_count > limit:
-            # Truncate to exact limit
-            truncated_content = content[:limit]
-            text_widget.delete("1.0", tk.END)
-            text_widget.insert("1.0", truncated_content)
+            # Truncate to exact limit by dropping only the overflow, keeping existing formatting tags
+            text_widget.delete(f"1.0 + {limit} chars", "end-1c")
 
             # Update counter to show limit reached
             if column_name in self.char_counters:
@@ -242,8 +277,6 @@ class ExcelOperationsMixin:
             tuple: (is_valid, formatted_time, error_message)
         """
         try:
-            import re
-
             # Remove whitespace
             time_input = time_input.strip()
 
@@ -251,32 +284,21 @@ class ExcelOperationsMixin:
             if not time_input:
                 return True, "", ""
 
-            # Pattern for HHMM format (auto-format to HH:MM)
-            hhmm_pattern = r'^(\d{4})$'
-            hhmm_match = re.match(hhmm_pattern, time_input)
-
-            if hhmm_match:
-                # Convert HHMM to HH:MM
-                time_digits = hhmm_match.group(1)
-                hour = int(time_digits[:2])
-                minute = int(time_digits[2:])
-
-                # Validate hour and minute ranges
-                if hour > 23:
-                    return False, time_input, f"Ogiltig timme: {hour}. Timme måste vara 00-23."
-                if minute > 59:
-                    return False, time_input, f"Ogiltig minut: {minute}. Minut måste vara 00-59."
-
-                formatted_time = f"{hour:02d}:{minute:02d}"
-                return True, formatted_time, ""
-
-            # Pattern for HH:MM format
-            hhMM_pattern = r'^(\d{1,2}):(\d{1,2})$'
-            hhMM_match = re.match(hhMM_pattern, time_input)
+            # Fast path for the fixed-width HHMM / HH:MM forms; regex only for odd widths (e.g. 9:5)
+            length = len(time_input)
+            if length == 4 and time_input.isdecimal():
+                # HHMM format (auto-format to HH:MM)
+                hour_text, minute_text = time_input[:2], time_input[2:]
+            elif length == 5 and time_input[2] == ':' and time_input[:2].isdecimal() and time_input[3:].isdecimal():
+                hour_text, minute_text = time_input[:2], time_input[3:]
+            elif (hhMM_match := _RE_HHCOLONMM.match(time_input)):
+                hour_text, minute_text = hhMM_match.groups()
+            else:
+                hour_text = minute_text = None
 
-            if hhMM_match:
-                hour = int(hhMM_match.group(1))
-                minute = int(hhMM_match.group(2))
+            if hour_text is not None:
+                hour = int(hour_text)
+                minute = int(minute_text)
 
                 # Validate hour and minute ranges
                 if hour > 23:
@@ -290,8 +312,6 @@ class ExcelOperationsMixin:
             # Invalid format
             return False, time_input, "Ogiltigt tidsformat. Använd HH:MM eller HHMM (24-timmars format)."
 
-        except ValueError as e:
-            return False, time_input, f"Ogiltigt tidsformat: {str(e)}"
         except Exception as e:
             logger.error(f"Error validating time format: {e}")
             return False, time_input, "Fel vid validering av tidsformat."
@@ -304,39 +324,7 @@ class ExcelOperationsMixin:
             event: FocusOut event
             field_name (str): Name of the time field ('Starttid' or 'Sluttid')
         """
-        logger.debug(f"validate_time_field called for {field_name}")
-        try:
-            entry_widget = event.widget
-            current_value = entry_widget.get()
-            logger.debug(f"Current value in {field_name}: '{current_value}'")
-
-            # Validate the time format
-            is_valid, formatted_time, error_message = self.validate_time_format(current_value)
-
-            if is_valid:
-                # Update the field with the formatted time
-                if current_value != formatted_time:
-                    logger.debug(f"Updating {field_name} - '{current_value}' → '{formatted_time}'")
-                    entry_widget.delete(0, tk.END)
-                    entry_widget.insert(0, formatted_time)
-
-                    # CRITICAL: Update the StringVar that Excel uses
-                    if field_name in self.excel_vars:
-                        self.excel_vars[field_name].set(formatted_time)
-                        logger.debug(f"StringVar updated for {field_name}: '{formatted_time}'")
-
-                    logger.info(f"Auto-formatted {field_name}: '{current_value}' → '{formatted_time}'")
-            else:
-                # Show error message
-                messagebox.showerror(
-                    "Ogiltigt tidsformat",
-                    f"Fel i fält '{field_name}': {error_message}"
-                )
-                # Focus back to the field for correction
-                entry_widget.focus_set()
-
-        except Exception as e:
-            logger.error(f"Error validating time field {field_name}: {e}")
+        self._validate_entry_on_focus_out(event, field_name, self.validate_time_format, "Ogiltigt tidsformat", "time")
 
     def validate_date_format(self, date_input):
         """
@@ -356,73 +344,61 @@ class ExcelOperationsMixin:
         Returns:
             tuple: (is_valid, formatted_date, error_message)
         """
-        logger.debug(f"validate_date_format called with input: '{date_input}'")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"validate_date_format called with input: '{date_input}'")
         try:
-            import re
-
             # Remove whitespace
             date_input = date_input.strip()
-            logger.debug(f"After trim: '{date_input}'")
+            if debug_enabled:
+                logger.debug(f"After trim: '{date_input}'")
 
             # Return empty for empty input
             if not date_input:
                 return True, "", ""
 
-            # Pattern for YYYY-MM-DD format (already correct)
-            yyyy_mm_dd_pattern = r'^(\d{4})-(\d{1,2})-(\d{1,2})$'
-            yyyy_mm_dd_match = re.match(yyyy_mm_dd_pattern, date_input)
-
-            if yyyy_mm_dd_match:
-                year = int(yyyy_mm_dd_match.group(1))
-                month = int(yyyy_mm_dd_match.group(2))
-                day = int(yyyy_mm_dd_match.group(3))
-
-                # Validate the date using datetime
-                try:
-                    from datetime import datetime
-                    datetime.strptime(f"{year}-{month:02d}-{day:02d}", '%Y-%m-%d')
-                    formatted_date = f"{year}-{month:02d}-{day:02d}"
-                    return True, formatted_date, ""
-                except ValueError:
+            # Fast paths for the fixed-width forms; regexes only for odd widths (e.g. 2025-1-5)
+            length = len(date_input)
+            date_parts = None
+            compact = False
+            if (length == 10 and date_input[4] == '-' and date_input[7] == '-'
+                    and date_input[:4].isdecimal() and date_input[5:7].isdecimal() and date_input[8:].isdecimal()):
+                # YYYY-MM-DD format (already correct)
+                date_parts = (date_input[:4], date_input[5:7], date_input[8:])
+            elif length == 8 and date_input.isdecimal():
+                # YYYYMMDD format (8 digits, convert to YYYY-MM-DD)
+                date_parts = (date_input[:4], date_input[4:6], date_input[6:])
+                compact = True
+            elif (yyyy_mm_dd_match := _RE_YYYY_MM_DD.match(date_input)):
+                date_parts = yyyy_mm_dd_match.groups()
+            else:
+                # Check for ambiguous century formats (YY-MM-DD / YYMMDD)
+                if debug_enabled:
+                    logger.debug(f"Checking century patterns for: '{date_input}'")
+                if _RE_YY_MM_DD.match(date_input) or _RE_YYMMDD.match(date_input):
+                    if debug_enabled:
+                        logger.debug(f"Century validation triggered - rejecting '{date_input}'")
+                    return False, date_input, "Du måste ange århundrade"
+
+            if date_parts is not None:
+                if compact and debug_enabled:
+                    logger.debug("YYYYMMDD pattern matched")
+                year, month, day = (int(part) for part in date_parts)
+
+                # Validate the calendar date
+                if not _valid_ymd(year, month, day):
+                    if compact and debug_enabled:
+                        logger.debug("YYYYMMDD validation failed - invalid date")
                     return False, date_input, "Ogiltigt datum. Kontrollera år, månad och dag."
 
-            # Check for ambiguous century formats FIRST (before YYYYMMDD check)
-            yy_mm_dd_pattern = r'^(\d{2})-(\d{1,2})-(\d{1,2})$'
-            yymmdd_pattern = r'^(\d{6})$'
-
-            logger.debug(f"Checking century patterns for: '{date_input}'")
-            if re.match(yy_mm_dd_pattern, date_input) or re.match(yymmdd_pattern, date_input):
-                logger.debug(f"Century validation triggered - rejecting '{date_input}'")
-                return False, date_input, "Du måste ange århundrade"
-
-            # Pattern for YYYYMMDD format (8 digits, convert to YYYY-MM-DD)
-            yyyymmdd_pattern = r'^(\d{8})$'
-            yyyymmdd_match = re.match(yyyymmdd_pattern, date_input)
-
-            logger.debug(f"Checking YYYYMMDD pattern for: '{date_input}'")
-            if yyyymmdd_match:
-                logger.debug("YYYYMMDD pattern matched")
-                date_digits = yyyymmdd_match.group(1)
-                year = int(date_digits[:4])
-                month = int(date_digits[4:6])
-                day = int(date_digits[6:8])
-
-                # Validate the date using datetime
-                try:
-                    from datetime import datetime
-                    datetime.strptime(f"{year}-{month:02d}-{day:02d}", '%Y-%m-%d')
-                    formatted_date = f"{year}-{month:02d}-{day:02d}"
+                formatted_date = f"{year}-{month:02d}-{day:02d}"
+                if compact and debug_enabled:
                     logger.debug(f"YYYYMMDD converted: '{date_input}' → '{formatted_date}'")
-                    return True, formatted_date, ""
-                except ValueError:
-                    logger.debug("YYYYMMDD validation failed - invalid date")
-                    return False, date_input, "Ogiltigt datum. Kontrollera år, månad och dag."
+                return True, formatted_date, ""
 
             # Invalid format
             return False, date_input, "Ogiltigt datumformat. Använd YYYY-MM-DD eller YYYYMMDD."
 
-        except ValueError as e:
-            return False, date_input, f"Ogiltigt datumformat: {str(e)}"
         except Exception as e:
             logger.error(f"Error validating date format: {e}")
             return False, date_input, "Fel vid validering av datumformat."
@@ -435,36 +411,47 @@ class ExcelOperationsMixin:
             event: FocusOut event
             field_name (str): Name of the date field ('Startdatum' or 'Slutdatum')
         """
-        logger.debug(f"validate_date_field called for {field_name}")
+        self._validate_entry_on_focus_out(event, field_name, self.validate_date_format, "Ogiltigt datumformat", "date")
+
+    def _validate_entry_on_focus_out(self, event, field_name, validator, error_title, kind):
+        """Shared FocusOut handler: reformat the entry in place or report the error and refocus it"""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Validating {kind} field {field_name}")
         try:
             entry_widget = event.widget
             current_value = entry_widget.get()
-            logger.debug(f"Current value in {field_name}: '{current_value}'")
+            if debug_enabled:
+                logger.debug(f"Current value in {field_name}: '{current_value}'")
 
-            # Validate the date format
-            is_valid, formatted_date, error_message = self.validate_date_format(current_value)
+            is_valid, formatted_value, error_message = validator(current_value)
 
             if is_valid:
-                # Update the field with the formatted date
-                if current_value != formatted_date:
-                    logger.debug(f"Updating {field_name} - '{current_value}' → '{formatted_date}'")
+                # Update the field with the formatted value
+                if current_value != formatted_value:
+                    if debug_enabled:
+                        logger.debug(f"Updating {field_name} - '{current_value}' → '{formatted_value}'")
                     entry_widget.delete(0, tk.END)
-                    entry_widget.insert(0, formatted_date)
+                    entry_widget.insert(0, formatted_value)
 
                     # CRITICAL: Update the StringVar that Excel uses
-                    if field_name in self.excel_vars:
-                        self.excel_vars[field_name].set(formatted_date)
-                        logger.debug(f"StringVar updated for {field_name}: '{formatted_date}'")
+                    var = self.excel_vars.get(field_name)
+                    if var is not None:
+                        var.set(formatted_value)
+                        if debug_enabled:
+                            logger.debug(f"StringVar updated for {field_name}: '{formatted_value}'")
 
-                    logger.info(f"Auto-formatted {field_name}: '{current_value}' → '{formatted_date}'")
+                    logger.info(f"Auto-formatted {field_name}: '{current_value}' → '{formatted_value}'")
             else:
                 # Show error message
-                messagebox.showerror(
-                    "Ogiltigt datumformat",
-                    f"Fel i fält '{field_name}': {error_message}"
-                )
+                self._report_validation_error(error_title, _FOCUS_OUT_ERROR_TEMPLATE,
+                                              field_name=field_name, error_msg=error_message)
                 # Focus back to the field for correction
                 entry_widget.focus_set()
 
         except Exception as e:
-            logger.error(f"Error validating date field {field_name}: {e}")
+            logger.error(f"Error validating {kind} field {field_name}: {e}")
+
+    def _report_validation_error(self, title, template, **values):
+        """Show a date/time validation error, formatting the message only when it is shown"""
+        messagebox.showerror(title, template.format(**values))
@@ -5,10 +5,11 @@ Based on user mockup requirements with two-column layout and comprehensive templ
 
 import logging
 import os
+from collections import Counter, OrderedDict
 from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -26,6 +27,28 @@ from core.template_manager import template_manager
 
 logger = logging.getLogger(__name__)
 
+# Validation state -> (icon text, icon color, counter color, entry border color)
+_VALIDATION_STYLES = {
+    "empty": ("⚪", "gray50", "gray50", "gray70"),
+    "valid": ("✅", "green", "green", "green"),
+    "invalid": ("❌", "red", "red", "red"),
+}
+
+# Counter color overrides for names close to or over the 13 character limit
+_LENGTH_COLORS = {"warn": "orange", "over": "red"}
+
+# (field_id, definition) pairs for each dialog column, the fields that can never be hidden and default names
+_LEFT_COLUMN_DEFS = tuple((field_id, FIELD_DEFINITIONS[field_id]) for field_id in LEFT_COLUMN_ORDER)
+_RIGHT_COLUMN_DEFS = tuple((field_id, FIELD_DEFINITIONS[field_id]) for field_id in RIGHT_COLUMN_ORDER)
+_REQUIRED_ENABLED_SET = frozenset(REQUIRED_ENABLED_FIELDS)
+_DEFAULT_NAMES = {field_id: field_def.default_display_name for field_id, field_def in FIELD_DEFINITIONS.items()}
+
+# Field row columns as (container name, fixed width in px)
+_ROW_COLUMNS = (("label", 140), ("entry", 250), ("counter", 55), ("icon", 35), ("checkbox", 85))
+
+# Pack options shared by the counter and icon cells (and their spacers)
+_CELL_PACK = {"padx": 5, "pady": 8, "anchor": "center"}
+
 
 class SavePromptChoice:
     """Constants for save prompt dialog return values"""
@@ -37,6 +60,15 @@ class SavePromptChoice:
 class FieldConfigDialog:
     """Redesigned field configuration dialog with template support and field visibility."""
 
+    # Delay before validating a field after the last keystroke, so a burst of typing validates once
+    VALIDATION_DEBOUNCE_MS = 200
+
+    # Number of validator results remembered per dialog session (oldest evicted first)
+    FEEDBACK_CACHE_SIZE = 256
+
+    DIALOG_WIDTH = 1000
+    DIALOG_HEIGHT = 800
+
     def __init__(self, parent_app, on_apply_callback: Optional[Callable] = None):
         self.parent_app = parent_app
         self.on_apply_callback = on_apply_callback
@@ -57,14 +89,26 @@ class FieldConfigDialog:
 
         # Field widgets storage
         self.field_entries: Dict[str, ctk.CTkEntry] = {}
+        self._entry_to_field: Dict[str, str] = {}  # Tk path of a CTkEntry -> field_id
         self.char_count_labels: Dict[str, ctk.CTkLabel] = {}
         self.validation_icons: Dict[str, ctk.CTkLabel] = {}
+        self._field_widgets: Dict[str, Tuple[ctk.CTkEntry, ctk.CTkLabel, ctk.CTkLabel]] = {}  # (entry, counter, icon)
         self.disable_checkboxes: Dict[str, ctk.CTkCheckBox] = {}  # Internal: disabled fields
 
         # Current field values and states
         self.current_values: Dict[str, str] = {}
-        self.current_disabled_fields: set = set()  # Internal: disabled fields
         self.validation_errors: Dict[str, str] = {}
+        self._dirty_fields: set = set()  # Fields changed since the last validation pass
+        self._validation_after_id: Optional[str] = None  # after() id of the debounced validation pass
+        # (value, field_id, duplicates another field) -> validator feedback
+        self._feedback_cache: "OrderedDict[Tuple[str, str, bool], dict]" = OrderedDict()
+        self._last_validation_style: Dict[str, Tuple[str, str]] = {}  # field_id -> (state, length bucket)
+        self._last_apply_error_count: Optional[int] = None  # Error count the apply button currently shows
+        self._help_dialog: Optional[ctk.CTkToplevel] = None  # Built on first use, then hidden and reused
+        self._yes_no_dialog: Optional[ctk.CTkToplevel] = None  # Same for the yes/no prompt
+        self._font_cache: Dict[Tuple[int, str], ctk.CTkFont] = {}  # (size, weight) -> font, see _font()
+        # (names, disabled fields, template) as loaded from the config, to detect a no-op apply
+        self._loaded_state: Optional[Tuple[Dict[str, str], frozenset, str]] = None
 
         # Create dialog
         self._create_dialog()
@@ -72,18 +116,26 @@ class FieldConfigDialog:
     def _create_dialog(self):
         """Create the main dialog window."""
         self.dialog = ctk.CTkToplevel(self.parent_app)
+        self.dialog.withdraw()  # Build hidden and map once, fully laid out
         self.dialog.title("Konfigurera Excel-fält")
-        self.dialog.geometry("1000x800")
         self.dialog.transient(self.parent_app)
-        self.dialog.grab_set()  # Modal dialog
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel)
 
-        # Center on parent
+        # Size and center on parent with a single geometry call
         self._center_dialog()
 
         # Configure grid
         self.dialog.grid_columnconfigure(0, weight=1)
         self.dialog.grid_rowconfigure(2, weight=1)
 
+        # Fonts shared by every field row, created once instead of per widget
+        self._fonts = {
+            'label': self._font(11, "bold"),
+            'entry': self._font(12),
+            'counter': self._font(10),
+            'icon': self._font(14),
+        }
+
         # Create main sections
         self._create_header()
         self._create_template_controls()
@@ -93,22 +145,46 @@ class FieldConfigDialog:
         # Load current values
         self._load_current_configuration()
 
-        # Start validation
-        self._update_validation()
+        # Start validation (freshly built rows are already in the empty style, so only filled fields need a pass)
+        self._update_validation(initial=True)
 
-    def _center_dialog(self):
-        """Center dialog on parent window."""
+        # One layout pass for the whole tree, then show it and make it modal (a grab needs a mapped window)
         self.dialog.update_idletasks()
+        self.dialog.deiconify()
+        self.dialog.grab_set()  # Modal dialog
+
+    def _font(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Return the dialog's shared CTkFont for size/weight, creating it on first use."""
+        key = (size, weight)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
+    def _place_over_dialog(self, toplevel, width: int, height: int, offset: int):
+        """Size a sub-dialog and place it offset px right of and below the main dialog's top-left corner.
 
-        # Get parent position and size
+        Sub-dialogs only open over the already-mapped main dialog, so its position is known without a layout pass.
+        """
+        x = self.dialog.winfo_rootx() + offset
+        y = self.dialog.winfo_rooty() + offset
+        toplevel.geometry(f"{width}x{height}+{x}+{y}")
+
+    def _center_dialog(self):
+        """Center dialog on parent window."""
+        # The parent is already mapped when the dialog opens, so its geometry can be read without
+        # draining the idle queue; an unmapped parent reports 1x1, so fall back to its requested size
         parent_x = self.parent_app.winfo_rootx()
         parent_y = self.parent_app.winfo_rooty()
         parent_width = self.parent_app.winfo_width()
         parent_height = self.parent_app.winfo_height()
+        if parent_width <= 1 or parent_height <= 1:
+            parent_width = self.parent_app.winfo_reqwidth()
+            parent_height = self.parent_app.winfo_reqheight()
 
         # Calculate center position
-        dialog_width = 1000
-        dialog_height = 800
+        dialog_width = self.DIALOG_WIDTH
+        dialog_height = self.DIALOG_HEIGHT
         x = parent_x + (parent_width // 2) - (dialog_width // 2)
         y = parent_y + (parent_height // 2) - (dialog_height // 2)
 
@@ -124,7 +200,7 @@ class FieldConfigDialog:
         title_label = ctk.CTkLabel(
             header_frame,
             text="Gör dina egna Excel-fältnamn",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=self._font(22, "bold")
         )
         title_label.grid(row=0, column=0, pady=(15, 5))
 
@@ -136,7 +212,7 @@ class FieldConfigDialog:
         instruction_label = ctk.CTkLabel(
             header_frame,
             text=instructions,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             text_color="gray60"
         )
         instruction_label.grid(row=1, column=0, pady=(0, 15))
@@ -182,7 +258,7 @@ class FieldConfigDialog:
         self.template_name_label = ctk.CTkLabel(
             template_frame,
             text="Aktuell mall: Standard",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             text_color="white",
             fg_color="#FF8C00",  # Orange background
             corner_radius=6,
@@ -205,33 +281,31 @@ class FieldConfigDialog:
 
     def _create_main_content(self):
         """Create main content area with two-column field layout."""
-        # Main scrollable frame
+        # Main scrollable frame (the left column does not fit the dialog height without scrolling)
         main_frame = ctk.CTkScrollableFrame(self.dialog)
         main_frame.grid(row=2, column=0, sticky="nsew", padx=20, pady=10)
         main_frame.grid_columnconfigure((0, 1), weight=1, uniform="column")
 
-        # Create two columns
-        self._create_left_column(main_frame)
-        self._create_right_column(main_frame)
+        # Create two columns with geometry propagation frozen so the rows are laid out in one pass
+        main_frame.grid_propagate(False)
+        try:
+            self._create_left_column(main_frame)
+            self._create_right_column(main_frame)
+        finally:
+            main_frame.grid_propagate(True)
 
     def _create_left_column(self, parent):
         """Create left column with first set of fields."""
-        row = 0
-        for field_id in LEFT_COLUMN_ORDER:
-            self._create_field_row(parent, field_id, row, 0)
-            row += 1
+        for row, (field_id, field_def) in enumerate(_LEFT_COLUMN_DEFS):
+            self._create_field_row(parent, field_id, field_def, row, 0)
 
     def _create_right_column(self, parent):
         """Create right column with second set of fields."""
-        row = 0
-        for field_id in RIGHT_COLUMN_ORDER:
-            self._create_field_row(parent, field_id, row, 1)
-            row += 1
+        for row, (field_id, field_def) in enumerate(_RIGHT_COLUMN_DEFS):
+            self._create_field_row(parent, field_id, field_def, row, 1)
 
-    def _create_field_row(self, parent, field_id: str, row: int, column: int):
+    def _create_field_row(self, parent, field_id: str, field_def, row: int, column: int):
         """Create a single field row with fixed-width container architecture for uniform alignment."""
-        field_def = FIELD_DEFINITIONS[field_id]
-
         # Main field container frame - don't use grid_propagate(False) on the main container
         field_frame = ctk.CTkFrame(parent)
         field_frame.grid(row=row, column=column, sticky="ew", padx=10, pady=2)
@@ -241,7 +315,7 @@ class FieldConfigDialog:
 
         # Determine field type and create appropriate components
         # Note: Checkbox availability is independent of field protection status
-        can_be_disabled = field_id not in REQUIRED_ENABLED_FIELDS
+        can_be_disabled = field_id not in _REQUIRED_ENABLED_SET
 
         if field_def.protected:
             self._create_protected_field_components(containers, field_id, field_def, can_be_disabled)
@@ -252,42 +326,13 @@ class FieldConfigDialog:
         """Create fixed-width container frames for uniform column alignment."""
         containers = {}
 
-        # Configure parent frame columns with fixed widths and no expansion
-        parent_frame.grid_columnconfigure(0, weight=0, minsize=140)  # Label
-        parent_frame.grid_columnconfigure(1, weight=0, minsize=250)  # Entry
-        parent_frame.grid_columnconfigure(2, weight=0, minsize=55)   # Counter
-        parent_frame.grid_columnconfigure(3, weight=0, minsize=35)   # Icon
-        parent_frame.grid_columnconfigure(4, weight=0, minsize=85)   # Checkbox
-
-        # Column 0: Label container (140px)
-        label_container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=140, height=40)
-        label_container.grid(row=0, column=0, sticky="w", padx=0, pady=0)
-        label_container.grid_propagate(False)
-        containers['label'] = label_container
-
-        # Column 1: Entry container (250px)
-        entry_container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=250, height=40)
-        entry_container.grid(row=0, column=1, sticky="w", padx=0, pady=0)
-        entry_container.grid_propagate(False)
-        containers['entry'] = entry_container
-
-        # Column 2: Counter container (55px)
-        counter_container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=55, height=40)
-        counter_container.grid(row=0, column=2, sticky="w", padx=0, pady=0)
-        counter_container.grid_propagate(False)
-        containers['counter'] = counter_container
-
-        # Column 3: Icon container (35px)
-        icon_container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=35, height=40)
-        icon_container.grid(row=0, column=3, sticky="w", padx=0, pady=0)
-        icon_container.grid_propagate(False)
-        containers['icon'] = icon_container
-
-        # Column 4: Checkbox container (85px)
-        checkbox_container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=85, height=40)
-        checkbox_container.grid(row=0, column=4, sticky="w", padx=0, pady=0)
-        checkbox_container.grid_propagate(False)
-        containers['checkbox'] = checkbox_container
+        # One fixed-width, non-propagating container per column (label, entry, counter, icon, checkbox)
+        for column, (name, width) in enumerate(_ROW_COLUMNS):
+            parent_frame.grid_columnconfigure(column, weight=0, minsize=width)
+            container = ctk.CTkFrame(parent_frame, fg_color="transparent", width=width, height=40)
+            container.grid(row=0, column=column, sticky="w", padx=0, pady=0)
+            container.grid_propagate(False)
+            containers[name] = container
 
         return containers
 
@@ -300,7 +345,7 @@ class FieldConfigDialog:
         field_label = ctk.CTkLabel(
             containers['label'],
             text=label_text,
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._fonts['label'],
             anchor="w"
         )
         field_label.pack(side="left", padx=(10, 5), pady=8, fill="y")
@@ -309,7 +354,7 @@ class FieldConfigDialog:
         protected_entry = ctk.CTkEntry(
             containers['entry'],
             placeholder_text=display_name,
-            font=ctk.CTkFont(size=12),
+            font=self._fonts['entry'],
             state="disabled",
             fg_color="gray90"
         )
@@ -335,42 +380,52 @@ class FieldConfigDialog:
         field_label = ctk.CTkLabel(
             containers['label'],
             text=label_text,
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._fonts['label'],
             anchor="w"
         )
         field_label.pack(side="left", padx=(10, 5), pady=8, fill="y")
 
+        # Widgets are created directly in the neutral style used for empty fields
+        empty_icon_text, empty_icon_color, empty_counter_color, empty_border_color = _VALIDATION_STYLES["empty"]
+
         # Editable entry in entry container
         entry = ctk.CTkEntry(
             containers['entry'],
             placeholder_text="Ange nytt namn...",
-            font=ctk.CTkFont(size=12)
+            font=self._fonts['entry'],
+            border_color=empty_border_color
         )
         entry.pack(fill="both", expand=True, padx=5, pady=6)
 
-        # Bind validation events
-        entry.bind('<KeyRelease>', lambda e, fid=field_id: self._on_field_change(fid))
-        entry.bind('<FocusOut>', lambda e, fid=field_id: self._on_field_change(fid))
+        # Bind validation events (shared handlers resolve the field from the event widget)
+        entry.bind('<KeyRelease>', self._on_entry_key_release)
+        entry.bind('<FocusOut>', self._on_entry_focus_out)
+        self._entry_to_field[str(entry)] = field_id
         self.field_entries[field_id] = entry
 
         # Character counter in counter container
         char_label = ctk.CTkLabel(
             containers['counter'],
             text="0/13",
-            font=ctk.CTkFont(size=10),
-            text_color="gray50"
+            font=self._fonts['counter'],
+            text_color=empty_counter_color
         )
-        char_label.pack(padx=5, pady=8, anchor="center")
+        char_label.pack(**_CELL_PACK)
         self.char_count_labels[field_id] = char_label
 
         # Validation icon in icon container
         icon_label = ctk.CTkLabel(
             containers['icon'],
-            text="⚪",
-            font=ctk.CTkFont(size=14)
+            text=empty_icon_text,
+            text_color=empty_icon_color,
+            font=self._fonts['icon']
         )
-        icon_label.pack(padx=5, pady=8, anchor="center")
+        icon_label.pack(**_CELL_PACK)
         self.validation_icons[field_id] = icon_label
+        self._field_widgets[field_id] = (entry, char_label, icon_label)
+
+        # Widgets start out in the neutral empty style, so the initial validation pass has nothing to repaint
+        self._last_validation_style[field_id] = ("empty", "normal")
 
         # Add checkbox if field can be disabled, otherwise add checkbox spacer
         if can_be_disabled:
@@ -393,20 +448,20 @@ class FieldConfigDialog:
         spacer = ctk.CTkLabel(
             container,
             text="",
-            font=ctk.CTkFont(size=10),
+            font=self._fonts['counter'],
             fg_color="transparent"
         )
-        spacer.pack(padx=5, pady=8, anchor="center")
+        spacer.pack(**_CELL_PACK)
 
     def _add_icon_spacer(self, container):
         """Add invisible validation icon spacer to match real icon dimensions."""
         spacer = ctk.CTkLabel(
             container,
             text="",
-            font=ctk.CTkFont(size=14),
+            font=self._fonts['icon'],
             fg_color="transparent"
         )
-        spacer.pack(padx=5, pady=8, anchor="center")
+        spacer.pack(**_CELL_PACK)
 
     def _add_checkbox_spacer(self, container):
         """Add invisible checkbox spacer to match real checkbox dimensions."""
@@ -466,46 +521,58 @@ class FieldConfigDialog:
         )
         self.apply_button.pack(side="left")
 
+    def _set_entry_values(self, values: Dict[str, str]):
+        """Show the given names in the field entries ("" for fields not in values).
+
+        Only entries whose text differs are rewritten, since each delete/insert redraws the entry.
+        """
+        for field_id, entry in self.field_entries.items():
+            value = values.get(field_id, "")
+            if entry.get() != value:
+                entry.delete(0, 'end')
+                if value:
+                    entry.insert(0, value)
+            # The counter may still show text typed before a cancel, even when the entry already matches
+            self._update_char_counter(field_id, value)
+        # Every renamable field keeps an entry in current_values ("" when it has no custom name)
+        self.current_values = {field_id: values.get(field_id, "") for field_id in self.field_entries}
+
+    def _set_disable_checkboxes(self, disabled_fields):
+        """Tick exactly the given fields' disable checkboxes, leaving already-correct ones untouched."""
+        for field_id, checkbox in self.disable_checkboxes.items():
+            is_disabled = field_id in disabled_fields
+            if bool(checkbox.get()) != is_disabled:
+                checkbox.select() if is_disabled else checkbox.deselect()
+
     def _load_current_configuration(self):
         """Load current field configuration and template."""
+        # Read the config file once and take every value from the same snapshot
+        config = self.config_manager.load_config()
+
         # Load active template name (fallback to "Standard")
-        self.current_template = self.config_manager.load_active_template() or "Standard"
+        self.current_template = self.config_manager.load_active_template(config) or "Standard"
 
         # Load current field names
-        custom_names = self.config_manager.load_custom_field_names()
+        custom_names = self.config_manager.load_custom_field_names(config)
         logger.info(f"Loading custom names: {custom_names}")
         field_manager.set_custom_names(custom_names)
 
         # Load field state
-        disabled_fields = self.config_manager.load_field_state()
+        disabled_fields = self.config_manager.load_field_state(config)
         logger.info(f"Loading disabled fields: {disabled_fields}")
         field_state_manager.set_disabled_fields(disabled_fields)
-        self.current_disabled_fields = set(disabled_fields)
-
-        # Populate field entries
-        for field_id, entry in self.field_entries.items():
-            current_name = field_manager.get_display_name(field_id)
-            field_def = FIELD_DEFINITIONS[field_id]
 
-            # Clear any existing content first
-            entry.delete(0, 'end')
-
-            # Only show custom names (not default names)
-            if current_name != field_def.default_display_name:
-                entry.insert(0, current_name)
-                self.current_values[field_id] = current_name
-                logger.debug(f"Set custom name for {field_id}: '{current_name}'")
-            else:
-                self.current_values[field_id] = ""
+        # Populate field entries (only custom names are shown, not default names)
+        self._set_entry_values({
+            field_id: name for field_id, name in custom_names.items()
+            if field_id in _DEFAULT_NAMES and name != _DEFAULT_NAMES[field_id]
+        })
 
         # Update disable checkboxes
-        for field_id, checkbox in self.disable_checkboxes.items():
-            is_disabled = field_id in self.current_disabled_fields
-            if is_disabled:
-                checkbox.select()
-                logger.debug(f"Set checkbox for {field_id} to disabled")
-            else:
-                checkbox.deselect()
+        self._set_disable_checkboxes(set(disabled_fields))
+        # Taken from the checkboxes, so fields that cannot be disabled compare the same way as in _apply_changes
+        loaded_disabled = frozenset(self._checked_disabled_fields())
+        self._loaded_state = (dict(self.current_values), loaded_disabled, self.current_template)
 
         logger.info(f"Config loading complete: {len(custom_names)} custom names, {len(disabled_fields)} disabled fields")
 
@@ -657,7 +724,7 @@ class FieldConfigDialog:
 
             field_config = {
                 'custom_names': custom_names,
-                'disabled_fields': list(self.current_disabled_fields)
+                'disabled_fields': self._checked_disabled_fields()
             }
 
             # Get template name from filename
@@ -718,23 +785,11 @@ class FieldConfigDialog:
             custom_names = template_config.get('custom_names', {})
             disabled_fields = template_config.get('disabled_fields', template_config.get('hidden_fields', []))
 
-            # Clear current entries
-            for entry in self.field_entries.values():
-                entry.delete(0, 'end')
-            self.current_values.clear()
-
             # Apply custom names
-            for field_id, custom_name in custom_names.items():
-                if field_id in self.field_entries:
-                    logger.debug(f"Inserting custom name for {field_id}: {custom_name}")
-                    self.field_entries[field_id].insert(0, custom_name)
-                    self.current_values[field_id] = custom_name
+            self._set_entry_values(custom_names)
 
             # Apply field state
-            self.current_disabled_fields = set(disabled_fields)
-            for field_id, checkbox in self.disable_checkboxes.items():
-                is_disabled = field_id in self.current_disabled_fields
-                checkbox.select() if is_disabled else checkbox.deselect()
+            self._set_disable_checkboxes(set(disabled_fields))
 
             # Update validation
             self._update_validation()
@@ -825,10 +880,6 @@ class FieldConfigDialog:
             logger.warning("current_values not initialized, returning empty config")
             return {'custom_names': {}, 'disabled_fields': []}
 
-        if not hasattr(self, 'current_disabled_fields') or self.current_disabled_fields is None:
-            logger.warning("current_disabled_fields not initialized, using empty set")
-            self.current_disabled_fields = set()
-
         # Extract custom names (only include non-empty, valid values)
         custom_names = {}
         for field_id, value in self.current_values.items():
@@ -841,7 +892,7 @@ class FieldConfigDialog:
 
         # Validate disabled fields list
         disabled_fields_list = []
-        for field_id in self.current_disabled_fields:
+        for field_id in self._checked_disabled_fields():
             if isinstance(field_id, str) and field_id in FIELD_DEFINITIONS:
                 disabled_fields_list.append(field_id)
             else:
@@ -876,22 +927,50 @@ class FieldConfigDialog:
         # Update button state when template name display changes
         self._update_template_buttons_state()
 
-    def _on_field_change(self, field_id: str):
+    def _field_id_for_event(self, event) -> Optional[str]:
+        """Resolve the field an entry event belongs to (events come from the CTkEntry's inner tk.Entry)."""
+        widget = event.widget
+        field_id = self._entry_to_field.get(str(widget))
+        if field_id is None and hasattr(widget, 'master'):
+            field_id = self._entry_to_field.get(str(widget.master))
+        return field_id
+
+    def _on_entry_key_release(self, event):
+        """Shared KeyRelease handler for all renamable field entries."""
+        field_id = self._field_id_for_event(event)
+        if field_id is not None:
+            self._on_field_change(field_id)
+
+    def _on_entry_focus_out(self, event):
+        """Shared FocusOut handler for all renamable field entries."""
+        field_id = self._field_id_for_event(event)
+        if field_id is not None:
+            self._on_field_change(field_id, immediate=True)
+
+    def _on_field_change(self, field_id: str, immediate: bool = False):
         """Handle field value changes."""
         logger.debug(f"Field change event for {field_id}, _loading_template={self._loading_template}")
 
-        entry = self.field_entries[field_id]
-        new_value = entry.get().strip()
+        new_value = self.field_entries[field_id].get().strip()
+        if new_value == self.current_values[field_id]:
+            # Navigation and modifier keys leave the text unchanged: no recount, revalidation or modified mark.
+            # Focus out still settles the field so a debounced validation never outlives it.
+            if immediate and self._dirty_fields:
+                self._flush_dirty_fields()
+            return
         self.current_values[field_id] = new_value
 
         # Update character counter
-        if field_id in self.char_count_labels:
-            char_label = self.char_count_labels[field_id]
-            char_label.configure(text=f"{len(new_value)}/13")
+        self._update_char_counter(field_id, new_value)
 
-        # Update validation
-        self._update_field_validation(field_id)
-        self._update_apply_button()
+        # Update validation - one debounced pass for all fields typed into, immediate on focus out
+        self._dirty_fields.add(field_id)
+        if immediate:
+            self._flush_dirty_fields()
+        else:
+            if self._validation_after_id is not None:
+                self.dialog.after_cancel(self._validation_after_id)
+            self._validation_after_id = self.dialog.after(self.VALIDATION_DEBOUNCE_MS, self._flush_dirty_fields)
 
         # Mark template as modified (only if not currently loading a template)
         if not self._loading_template:
@@ -903,16 +982,21 @@ class FieldConfigDialog:
         else:
             logger.debug(f"Ignoring field change during template loading for {field_id}")
 
-    def _on_hide_checkbox_changed(self, field_id: str):
-        """Handle hide checkbox changes."""
-        checkbox = self.disable_checkboxes[field_id]
-        is_checked = checkbox.get()
+    def _update_char_counter(self, field_id: str, value: str):
+        """Show the length of value in the field's character counter, skipping the redraw when unchanged."""
+        char_label = self.char_count_labels.get(field_id)
+        text = f"{len(value)}/13"
+        if char_label is not None and char_label.cget("text") != text:
+            char_label.configure(text=text)
 
-        if is_checked:
-            self.current_disabled_fields.add(field_id)
-        else:
-            self.current_disabled_fields.discard(field_id)
+    def _checked_disabled_fields(self) -> List[str]:
+        """Fields whose disable checkbox is ticked, in dialog order."""
+        return [field_id for field_id, checkbox in self.disable_checkboxes.items() if checkbox.get()]
 
+    def _on_hide_checkbox_changed(self, field_id: str):
+        """Handle hide checkbox changes."""
+        # The checkboxes are the source of truth; consumers read them via _checked_disabled_fields()
+        is_checked = self.disable_checkboxes[field_id].get()
         logger.debug(f"Field {field_id} visibility changed: {'hidden' if is_checked else 'visible'}")
 
         # Mark template as modified (only if not currently loading a template)
@@ -925,65 +1009,131 @@ class FieldConfigDialog:
         else:
             logger.debug(f"Ignoring checkbox change during template loading for {field_id}")
 
-    def _update_field_validation(self, field_id: str):
-        """Update validation display for a specific field."""
-        if field_id not in self.field_entries:
+    def _flush_dirty_fields(self):
+        """Validate the changed fields in one pass and refresh the apply button once."""
+        dirty = self._dirty_fields
+        self._cancel_pending_validation()
+        if not dirty or not self.dialog.winfo_exists():
             return
 
-        entry = self.field_entries[field_id]
-        icon_label = self.validation_icons[field_id]
-        char_label = self.char_count_labels[field_id]
+        # A changed name can create or clear a duplicate elsewhere, so filled fields are revisited as well;
+        # their feedback is cached and _apply_validation_style only repaints widgets whose style changed
+        name_counts = Counter(value.strip() for value in self.current_values.values() if value and value.strip())
+        for field_id in self.field_entries:
+            if field_id in dirty or self.current_values.get(field_id):
+                self._update_field_validation(field_id, name_counts)
+        self._update_apply_button()
+
+    def _cancel_pending_validation(self):
+        """Cancel the debounced validation pass and forget the fields waiting on it."""
+        if self._validation_after_id is not None:
+            try:
+                self.dialog.after_cancel(self._validation_after_id)
+            except Exception:
+                pass
+            self._validation_after_id = None
+        self._dirty_fields = set()
+
+    def _update_field_validation(self, field_id: str, name_counts: Optional[Counter] = None):
+        """Update validation display for a specific field.
+
+        name_counts (stripped name -> number of fields using it) lets a batch pass share one duplicate count.
+        """
+        if field_id not in self.field_entries:
+            return
 
-        value = self.current_values.get(field_id, "")
+        value = self.current_values[field_id]
 
         if not value:
             # Empty field - neutral state
-            icon_label.configure(text="⚪", text_color="gray50")
-            char_label.configure(text_color="gray50")
-            entry.configure(border_color="gray70")
+            self._apply_validation_style(field_id, "empty", "normal")
             self.validation_errors.pop(field_id, None)
             return
 
-        # Get validation feedback with live context for real-time duplicate detection
-        feedback = realtime_validator.get_instant_feedback_with_context(
-            name=value,
-            original_name=field_id,
-            current_context=self.current_values
-        )
+        # Get validation feedback with live context for real-time duplicate detection.
+        # Apart from the value itself, the result only depends on whether another field holds the same name.
+        stripped = value.strip()
+        if name_counts is not None:
+            is_duplicate = name_counts[stripped] > 1
+        else:
+            is_duplicate = any(
+                other_id != field_id and other_value and other_value.strip() == stripped
+                for other_id, other_value in self.current_values.items()
+            )
+        key = (value, field_id, is_duplicate)
+        feedback = self._feedback_cache.get(key)
+        if feedback is None:
+            feedback = realtime_validator.get_instant_feedback_with_context(
+                name=value,
+                original_name=field_id,
+                current_context=self.current_values
+            )
+            self._feedback_cache[key] = feedback
+            if len(self._feedback_cache) > self.FEEDBACK_CACHE_SIZE:
+                self._feedback_cache.popitem(last=False)
+        else:
+            self._feedback_cache.move_to_end(key)
 
-        # Update icon and colors
         if feedback['is_valid']:
-            icon_label.configure(text="✅", text_color="green")
-            char_label.configure(text_color="green")
-            entry.configure(border_color="green")
+            state = "valid"
             self.validation_errors.pop(field_id, None)
         else:
-            icon_label.configure(text="❌", text_color="red")
-            char_label.configure(text_color="red")
-            entry.configure(border_color="red")
+            state = "invalid"
             self.validation_errors[field_id] = feedback['messages'][0] if feedback['messages'] else "Ogiltigt namn"
 
-        # Update character count color based on length
-        if len(value) > 13:
-            char_label.configure(text_color="red")
-        elif len(value) > 10:
-            char_label.configure(text_color="orange")
+        # Character count color bucket based on length
+        length = len(value)
+        if length > 13:
+            length_bucket = "over"
+        elif length > 10:
+            length_bucket = "warn"
+        else:
+            length_bucket = "normal"
+
+        self._apply_validation_style(field_id, state, length_bucket)
 
-    def _update_validation(self):
-        """Update validation for all fields."""
-        for field_id in self.field_entries.keys():
-            self._update_field_validation(field_id)
+    def _apply_validation_style(self, field_id: str, state: str, length_bucket: str):
+        """Style a field's icon, counter and border, skipping configure() calls that change nothing."""
+        previous = self._last_validation_style.get(field_id)
+        current = (state, length_bucket)
+        if current == previous:
+            return
+        self._last_validation_style[field_id] = current
+
+        entry, char_label, icon_label = self._field_widgets[field_id]
+        icon_text, icon_color, state_color, border_color = _VALIDATION_STYLES[state]
+        if previous is None or previous[0] != state:
+            icon_label.configure(text=icon_text, text_color=icon_color)
+            entry.configure(border_color=border_color)
+
+        # Length warnings override the state color for non-empty fields
+        char_color = state_color if state == "empty" else _LENGTH_COLORS.get(length_bucket, state_color)
+        char_label.configure(text_color=char_color)
+
+    def _update_validation(self, initial: bool = False):
+        """Update validation for all fields (initial: skip empty fields of a just-built dialog)."""
+        self._cancel_pending_validation()
+        # Count every name once so the duplicate check is O(1) per field instead of a rescan of all fields
+        name_counts = Counter(value.strip() for value in self.current_values.values() if value and value.strip())
+        for field_id in self.field_entries:
+            if initial and not self.current_values.get(field_id):
+                continue
+            self._update_field_validation(field_id, name_counts)
         self._update_apply_button()
 
     def _update_apply_button(self):
         """Enable/disable apply button based on validation."""
-        has_errors = bool(self.validation_errors)
+        # The button only depends on the error count; skip the configure() when it is unchanged
+        error_count = len(self.validation_errors)
+        if error_count == self._last_apply_error_count:
+            return
+        self._last_apply_error_count = error_count
 
-        if has_errors:
+        if error_count:
             self.apply_button.configure(
                 state="disabled",
                 fg_color="gray50",
-                text=f"Åtgärda {len(self.validation_errors)} fel först"
+                text=f"Åtgärda {error_count} fel först"
             )
         else:
             self.apply_button.configure(
@@ -994,20 +1144,14 @@ class FieldConfigDialog:
 
     def _reset_to_defaults(self):
         """Reset all fields to default values."""
-        if not messagebox.askyesno("Återställ till standard", "Vill du återställa alla fält till standardvärden?"):
+        if not self._ask_yes_no("Återställ till standard", "Vill du återställa alla fält till standardvärden?"):
             return
 
         # Clear all entries
-        for entry in self.field_entries.values():
-            entry.delete(0, 'end')
-
-        self.current_values.clear()
+        self._set_entry_values({})
 
         # Reset visibility checkboxes
-        for checkbox in self.disable_checkboxes.values():
-            checkbox.deselect()
-
-        self.current_disabled_fields.clear()
+        self._set_disable_checkboxes(())
 
         # Reset template state to Standard
         self.current_template = "Standard"
@@ -1022,9 +1166,20 @@ class FieldConfigDialog:
 
     def _apply_changes(self):
         """Apply field name changes and visibility settings."""
+        # Validate any field still waiting on its debounce so errors are current
+        if self._dirty_fields:
+            self._flush_dirty_fields()
+
         if self.validation_errors:
             return  # Should not happen if button is properly disabled
 
+        # Nothing changed since the configuration was loaded: close without the confirm dialog or a save
+        current_state = (self.current_values, frozenset(self._checked_disabled_fields()), self.current_template)
+        if current_state == self._loaded_state:
+            logger.info("No field configuration changes to apply")
+            self._hide()
+            return
+
         # Check if template has been modified and show save prompt
         if self.is_template_modified:
             save_choice = self._show_save_prompt()
@@ -1050,30 +1205,27 @@ class FieldConfigDialog:
             if value.strip():
                 custom_names[field_id] = value.strip()
 
+        # Read the disabled fields from the checkboxes once; none of the consumers mutate the list
+        disabled_fields = self._checked_disabled_fields()
+
         # Apply changes
         try:
-            # Save custom names
-            self.config_manager.save_custom_field_names(custom_names)
-
-            # Save field visibility
-            self.config_manager.save_field_state(list(self.current_disabled_fields))
+            # Save custom names, field visibility and the active template in one config write
+            self.config_manager.save_field_configuration(custom_names, disabled_fields, self.current_template)
 
             # Update field manager
             field_manager.set_custom_names(custom_names)
-            field_manager.set_disabled_fields(list(self.current_disabled_fields))
-            field_state_manager.set_disabled_fields(list(self.current_disabled_fields))
+            field_manager.set_disabled_fields(disabled_fields)
+            field_state_manager.set_disabled_fields(disabled_fields)
 
-            logger.info(f"Applied configuration: {len(custom_names)} custom names, {len(self.current_disabled_fields)} disabled fields")
-
-            # Save active template name for persistence
-            self.config_manager.save_active_template(self.current_template)
+            logger.info(f"Applied configuration: {len(custom_names)} custom names, {len(disabled_fields)} disabled fields")
 
             # Call the callback to trigger application update
             if self.on_apply_callback:
                 self.on_apply_callback()
 
             # Close dialog
-            self.dialog.destroy()
+            self._hide()
 
         except Exception as e:
             logger.error(f"Failed to apply configuration: {e}")
@@ -1083,23 +1235,17 @@ class FieldConfigDialog:
         """Show save prompt dialog when template has modifications."""
         save_dialog = ctk.CTkToplevel(self.dialog)
         save_dialog.title("Spara ändringar?")
-        save_dialog.geometry("500x300")
+        self._place_over_dialog(save_dialog, 500, 300, 200)
         save_dialog.transient(self.dialog)
         save_dialog.grab_set()
 
-        # Center on parent dialog
-        self.dialog.update_idletasks()
-        x = self.dialog.winfo_rootx() + 200
-        y = self.dialog.winfo_rooty() + 200
-        save_dialog.geometry(f"500x300+{x}+{y}")
-
         result = {"choice": SavePromptChoice.CANCEL}
 
         # Warning icon and title
         warning_label = ctk.CTkLabel(
             save_dialog,
             text="💾 SPARA ÄNDRINGAR?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             text_color="#FF8C00"
         )
         warning_label.pack(pady=(20, 15))
@@ -1108,7 +1254,7 @@ class FieldConfigDialog:
         message_label = ctk.CTkLabel(
             save_dialog,
             text=f"Du har gjort ändringar i mallen '{self.current_template}'.\n\nVad vill du göra innan ändringarna tillämpas?",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             justify="center",
             wraplength=400
         )
@@ -1185,23 +1331,17 @@ class FieldConfigDialog:
         """Handle save failure scenario - return True to continue, False to cancel."""
         failure_dialog = ctk.CTkToplevel(self.dialog)
         failure_dialog.title("Kunde inte spara")
-        failure_dialog.geometry("400x200")
+        self._place_over_dialog(failure_dialog, 400, 200, 250)
         failure_dialog.transient(self.dialog)
         failure_dialog.grab_set()
 
-        # Center on parent dialog
-        self.dialog.update_idletasks()
-        x = self.dialog.winfo_rootx() + 250
-        y = self.dialog.winfo_rooty() + 250
-        failure_dialog.geometry(f"400x200+{x}+{y}")
-
         result = {"continue": False}
 
         # Error message
         error_label = ctk.CTkLabel(
             failure_dialog,
             text="⚠️ Kunde inte spara mallen",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             text_color="#FF6B35"
         )
         error_label.pack(pady=(20, 10))
@@ -1209,7 +1349,7 @@ class FieldConfigDialog:
         message_label = ctk.CTkLabel(
             failure_dialog,
             text="Mallen kunde inte sparas.\nVill du fortsätta ändå utan att spara?",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             justify="center"
         )
         message_label.pack(pady=(0, 20))
@@ -1288,21 +1428,15 @@ class FieldConfigDialog:
         """Show error feedback when template save fails."""
         error_dialog = ctk.CTkToplevel(self.dialog)
         error_dialog.title("Kunde inte spara")
-        error_dialog.geometry("400x200")
+        self._place_over_dialog(error_dialog, 400, 200, 250)
         error_dialog.transient(self.dialog)
         error_dialog.grab_set()
 
-        # Center on parent dialog
-        self.dialog.update_idletasks()
-        x = self.dialog.winfo_rootx() + 250
-        y = self.dialog.winfo_rooty() + 250
-        error_dialog.geometry(f"400x200+{x}+{y}")
-
         # Error message
         error_label = ctk.CTkLabel(
             error_dialog,
             text="❌ Kunde inte spara mall",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             text_color="#DC3545"
         )
         error_label.pack(pady=(20, 10))
@@ -1310,7 +1444,7 @@ class FieldConfigDialog:
         detail_label = ctk.CTkLabel(
             error_dialog,
             text=error_message,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             wraplength=350,
             justify="center"
         )
@@ -1330,76 +1464,24 @@ class FieldConfigDialog:
 
     def _confirm_apply(self) -> bool:
         """Show confirmation dialog for applying changes."""
-        confirm_dialog = ctk.CTkToplevel(self.dialog)
-        confirm_dialog.title("Bekräfta ändringar")
-        confirm_dialog.geometry("450x250")
-        confirm_dialog.transient(self.dialog)
-        confirm_dialog.grab_set()
-
-        # Center on parent dialog
-        self.dialog.update_idletasks()
-        x = self.dialog.winfo_rootx() + 275
-        y = self.dialog.winfo_rooty() + 275
-        confirm_dialog.geometry(f"450x250+{x}+{y}")
-
-        result = {"confirmed": False}
-
-        # Warning text
-        warning_label = ctk.CTkLabel(
-            confirm_dialog,
-            text="⚠️ BEKRÄFTA ÄNDRINGAR",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#FF6B35"
+        return self._ask_yes_no(
+            "Bekräfta ändringar",
+            "Detta kommer att tillämpa de nya fältnamnen och synlighetsinställningarna.\n\n"
+            "Klicka 'Tillämpa' för att fortsätta eller 'Avbryt' för att återgå.",
+            yes_text="Tillämpa",
+            no_text="Avbryt",
+            heading="⚠️ BEKRÄFTA ÄNDRINGAR"
         )
-        warning_label.pack(pady=(20, 10))
-
-        message_label = ctk.CTkLabel(
-            confirm_dialog,
-            text="Detta kommer att tillämpa de nya fältnamnen och synlighetsinställningarna.\n\nKlicka 'Tillämpa' för att fortsätta eller 'Avbryt' för att återgå.",
-            font=ctk.CTkFont(size=12),
-            justify="center"
-        )
-        message_label.pack(pady=10, padx=20)
-
-        # Buttons
-        button_frame = ctk.CTkFrame(confirm_dialog, fg_color="transparent")
-        button_frame.pack(pady=20)
-
-        def confirm():
-            result["confirmed"] = True
-            confirm_dialog.destroy()
-
-        def cancel():
-            result["confirmed"] = False
-            confirm_dialog.destroy()
-
-        cancel_btn = ctk.CTkButton(
-            button_frame,
-            text="Avbryt",
-            width=100,
-            fg_color="gray60",
-            hover_color="gray50",
-            command=cancel
-        )
-        cancel_btn.pack(side="left", padx=(0, 10))
-
-        confirm_btn = ctk.CTkButton(
-            button_frame,
-            text="Tillämpa",
-            width=100,
-            fg_color="#28A745",
-            hover_color="#218838",
-            command=confirm
-        )
-        confirm_btn.pack(side="left")
-
-        # Wait for dialog to close
-        confirm_dialog.wait_window()
-
-        return result["confirmed"]
 
     def _show_help(self):
         """Show help information."""
+        # Reuse the help window from an earlier invocation (it is hidden, not destroyed, on close)
+        if self._help_dialog is not None and self._help_dialog.winfo_exists():
+            self._help_dialog.deiconify()
+            self._help_dialog.lift()
+            self._help_dialog.grab_set()
+            return
+
         help_text = """HJÄLP: Konfigurera Excel-fältnamn och synlighet
 
 FUNKTIONER:
@@ -1432,6 +1514,8 @@ Klicka "Använd dessa namn" när du är klar."""
         help_dialog.geometry("600x500")
         help_dialog.transient(self.dialog)
         help_dialog.grab_set()
+        help_dialog.protocol("WM_DELETE_WINDOW", self._hide_help)
+        self._help_dialog = help_dialog
 
         text_widget = ctk.CTkTextbox(help_dialog, wrap="word")
         text_widget.pack(fill="both", expand=True, padx=20, pady=20)
@@ -1441,10 +1525,77 @@ Klicka "Använd dessa namn" när du är klar."""
         close_button = ctk.CTkButton(
             help_dialog,
             text="Stäng",
-            command=help_dialog.destroy
+            command=self._hide_help
         )
         close_button.pack(pady=(0, 20))
 
+    def _hide_help(self):
+        """Hide the help window so the next _show_help can reuse it."""
+        self._help_dialog.grab_release()
+        self._help_dialog.withdraw()
+
+    def _ask_yes_no(self, title: str, message: str, yes_text: str = "Ja", no_text: str = "Nej",
+                    heading: Optional[str] = None) -> bool:
+        """Ask a yes/no question in a CTk prompt that is built on first use and reused afterwards."""
+        if self._yes_no_dialog is None or not self._yes_no_dialog.winfo_exists():
+            prompt = ctk.CTkToplevel(self.dialog)
+            prompt.withdraw()
+            prompt.geometry("450x250")
+            prompt.transient(self.dialog)
+            self._yes_no_answer = ctk.BooleanVar(prompt, value=False)
+            prompt.protocol("WM_DELETE_WINDOW", lambda: self._yes_no_answer.set(False))
+
+            self._yes_no_heading = ctk.CTkLabel(
+                prompt,
+                font=self._font(16, "bold"),
+                text_color="#FF6B35"
+            )
+            self._yes_no_label = ctk.CTkLabel(prompt, wraplength=400, justify="center", font=self._fonts['entry'])
+            self._yes_no_label.pack(expand=True, padx=20, pady=(20, 10))
+
+            button_frame = ctk.CTkFrame(prompt, fg_color="transparent")
+            button_frame.pack(pady=(0, 20))
+
+            self._yes_no_no_button = ctk.CTkButton(
+                button_frame,
+                width=100,
+                fg_color="gray60",
+                hover_color="gray50",
+                command=lambda: self._yes_no_answer.set(False)
+            )
+            self._yes_no_no_button.pack(side="left", padx=(0, 10))
+
+            self._yes_no_yes_button = ctk.CTkButton(
+                button_frame,
+                width=100,
+                fg_color="#28A745",
+                hover_color="#218838",
+                command=lambda: self._yes_no_answer.set(True)
+            )
+            self._yes_no_yes_button.pack(side="left")
+            self._yes_no_dialog = prompt
+
+        prompt = self._yes_no_dialog
+        prompt.title(title)
+        self._yes_no_label.configure(text=message)
+        self._yes_no_yes_button.configure(text=yes_text)
+        self._yes_no_no_button.configure(text=no_text)
+        if heading:
+            self._yes_no_heading.configure(text=heading)
+            self._yes_no_heading.pack(before=self._yes_no_label, pady=(20, 0))
+        else:
+            self._yes_no_heading.pack_forget()
+        self._place_over_dialog(prompt, 450, 250, 275)
+        prompt.deiconify()
+        prompt.grab_set()
+
+        # Every button (and closing the window) writes the variable, which ends the wait
+        prompt.wait_variable(self._yes_no_answer)
+        prompt.grab_release()
+        prompt.withdraw()
+        self.dialog.grab_set()
+        return self._yes_no_answer.get()
+
     def _show_error(self, title: str, message: str):
         """Show error dialog."""
         error_dialog = ctk.CTkToplevel(self.dialog)
@@ -1457,7 +1608,7 @@ Klicka "Använd dessa namn" när du är klar."""
             error_dialog,
             text=message,
             wraplength=350,
-            font=ctk.CTkFont(size=12)
+            font=self._font(12)
         )
         error_label.pack(expand=True, padx=20, pady=20)
 
@@ -1470,14 +1621,33 @@ Klicka "Använd dessa namn" när du är klar."""
 
     def _cancel(self):
         """Cancel dialog without saving."""
-        # Cancel any pending after() callbacks before destroying
+        self._hide()
+
+    def _hide(self):
+        """Hide the dialog, keeping its widgets so the next open can reuse them."""
+        # Cancel any pending after() callbacks before hiding
+        self._cancel_pending_validation()
         for after_id in [self._loading_flag_after_id, self._flash_after_id]:
             if after_id is not None:
                 try:
                     self.dialog.after_cancel(after_id)
                 except Exception:
                     pass
-        self.dialog.destroy()
+        self._loading_flag_after_id = None
+        self._flash_after_id = None
+        self._loading_template = False
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+
+    def reopen(self, on_apply_callback: Optional[Callable] = None):
+        """Show a previously hidden dialog again with freshly loaded configuration."""
+        self.on_apply_callback = on_apply_callback
+        self.dialog.deiconify()
+        self._center_dialog()
+        self.dialog.grab_set()
+
+        self._load_current_configuration()
+        self._update_validation()
 
     def show(self):
         """Show the dialog."""
@@ -1488,6 +1658,12 @@ Klicka "Använd dessa namn" när du är klar."""
 
 def show_field_config_dialog(parent_app, on_apply_callback=None):
     """Convenience function to show the field configuration dialog."""
-    dialog = FieldConfigDialog(parent_app, on_apply_callback)
+    # The dialog is built once per parent and hidden on close; later opens reuse its widgets
+    dialog = getattr(parent_app, '_field_config_dialog', None)
+    if dialog is not None and dialog.dialog.winfo_exists():
+        dialog.reopen(on_apply_callback)
+    else:
+        dialog = FieldConfigDialog(parent_app, on_apply_callback)
+        parent_app._field_config_dialog = dialog
     dialog.show()
     return dialog
@@ -5,7 +5,7 @@ Provides consistent styling for disabled fields across the application.
 
 import logging
 import tkinter as tk
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -35,6 +35,43 @@ class FieldStyling:
         'label_color': 'black',          # Standard label color
     }
 
+    # Resolved style dicts keyed by (widget_type, enabled); built on first use since label
+    # styles hold CTkFont objects, which need a Tk root
+    _style_cache: Dict[Tuple[str, bool], Dict[str, Any]] = {}
+
+    _STYLE_GETTERS = {
+        ('entry', False): 'get_disabled_entry_style',
+        ('text', False): 'get_disabled_text_style',
+        ('checkbox', False): 'get_disabled_checkbox_style',
+        ('label', False): 'get_disabled_label_style',
+        ('entry', True): 'get_enabled_entry_style',
+        ('text', True): 'get_enabled_text_style',
+        ('checkbox', True): 'get_enabled_checkbox_style',
+        ('label', True): 'get_enabled_label_style',
+    }
+
+    @classmethod
+    def get_cached_style(cls, widget_type: str, enabled: bool) -> Optional[Dict[str, Any]]:
+        """
+        Get the shared style dict for a widget type, resolving it only once.
+
+        Args:
+            widget_type: Type of widget ('entry', 'text', 'checkbox', 'label')
+            enabled: True for enabled styling, False for disabled styling
+
+        Returns:
+            Style dictionary (do not mutate), or None for unknown widget types
+        """
+        key = (widget_type, enabled)
+        style = cls._style_cache.get(key)
+        if style is None:
+            getter = cls._STYLE_GETTERS.get(key)
+            if getter is None:
+                return None
+            style = getattr(cls, getter)()
+            cls._style_cache[key] = style
+        return style
+
     @classmethod
     def get_disabled_entry_style(cls) -> Dict[str, Any]:
         """
@@ -178,15 +215,8 @@ class FieldStyling:
             True if styling was applied successfully, False otherwise
         """
         try:
-            if widget_type == 'entry':
-                style = cls.get_disabled_entry_style()
-            elif widget_type == 'text':
-                style = cls.get_disabled_text_style()
-            elif widget_type == 'checkbox':
-                style = cls.get_disabled_checkbox_style()
-            elif widget_type == 'label':
-                style = cls.get_disabled_label_style()
-            else:
+            style = cls.get_cached_style(widget_type, enabled=False)
+            if style is None:
                 logger.warning(f"Unknown widget type for styling: {widget_type}")
                 return False
 
@@ -217,15 +247,8 @@ class FieldStyling:
             True if styling was applied successfully, False otherwise
         """
         try:
-            if widget_type == 'entry':
-                style = cls.get_enabled_entry_style()
-            elif widget_type == 'text':
-                style = cls.get_enabled_text_style()
-            elif widget_type == 'checkbox':
-                style = cls.get_enabled_checkbox_style()
-            elif widget_type == 'label':
-                style = cls.get_enabled_label_style()
-            else:
+            style = cls.get_cached_style(widget_type, enabled=True)
+            if style is None:
                 logger.warning(f"Unknown widget type for styling: {widget_type}")
                 return False
 
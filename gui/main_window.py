@@ -320,6 +320,8 @@ class PDFProcessorApp(PDFOperationsMixin, ExcelOperationsMixin, LayoutManagerMix
 
         # Excel column variables
         self.excel_vars = {}
+        # Display names of excel_vars entries backed by Text widgets rather than StringVars
+        self._text_fields = set()
 
         # Character counters for text fields (1000 char limit for all text fields)
         self.char_counters = {}
@@ -474,7 +476,7 @@ class PDFProcessorApp(PDFOperationsMixin, ExcelOperationsMixin, LayoutManagerMix
     def _initialize_lock_vars(self):
         """Initialize lock variables with current field display names"""
         try:
-            from core.field_definitions import FIELD_DEFINITIONS, field_manager
+            from core.field_definitions import FIELD_DEFINITIONS, LOCKABLE_FIELDS, field_manager
 
             # Debug: Check field_manager state before initialization
             logger.debug(f"field_manager custom names at lock_vars init: {field_manager.get_custom_names()}")
@@ -486,9 +488,9 @@ class PDFProcessorApp(PDFOperationsMixin, ExcelOperationsMixin, LayoutManagerMix
 
             # Create lock variables for all lockable fields (all except 'dag' and 'inlagd')
             field_mappings = []
-            for field_id, _field_def in FIELD_DEFINITIONS.items():
+            for field_id in FIELD_DEFINITIONS:
                 # Skip fields that shouldn't have locks
-                if field_id in ['dag', 'inlagd']:
+                if field_id not in LOCKABLE_FIELDS:
                     continue
 
                 # Get the current display name (could be custom or default)
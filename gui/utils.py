@@ -8,6 +8,25 @@ import tkinter as tk
 import customtkinter as ctk
 
 
+def get_hover_color(base_color):
+    """Generate a slightly darker hover color for buttons"""
+    if base_color == "#FFFFFF":
+        return "#F0F0F0"
+    # Simple darkening by reducing each RGB component
+    try:
+        # Convert hex to RGB
+        r = int(base_color[1:3], 16)
+        g = int(base_color[3:5], 16)
+        b = int(base_color[5:7], 16)
+        # Darken by 20
+        r = max(0, r - 20)
+        g = max(0, g - 20)
+        b = max(0, b - 20)
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except (ValueError, IndexError):
+        return base_color
+
+
 class ToolTip:
     """Create a tooltip for a given widget"""
 
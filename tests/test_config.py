@@ -290,6 +290,39 @@ class TestConfigManager:
         assert contents == {}
         assert formats == {}
 
+    @patch.object(ConfigManager, 'load_config')
+    def test_field_loaders_use_given_config(self, mock_load):
+        """Test that field config loaders read a passed-in config instead of the file"""
+        config = {
+            "custom_field_names": {"note1": "Anteckning"},
+            "hidden_fields": ["kalla2"],
+            "active_template": "Min mall"
+        }
+
+        manager = ConfigManager()
+
+        assert manager.load_custom_field_names(config) == {"note1": "Anteckning"}
+        assert manager.load_field_state(config) == ["kalla2"]
+        assert manager.load_active_template(config) == "Min mall"
+        mock_load.assert_not_called()
+
+    @patch.object(ConfigManager, 'save_config')
+    @patch.object(ConfigManager, 'load_config')
+    def test_save_field_configuration_single_write(self, mock_load, mock_save):
+        """Test that names, field state and template are saved with one config write"""
+        mock_load.return_value = {"excel_file": "test.xlsx"}
+
+        manager = ConfigManager()
+        manager.save_field_configuration({"note1": "Anteckning"}, ["kalla2"], "Min mall")
+
+        mock_save.assert_called_once()
+        saved_config = mock_save.call_args[0][0]
+        assert saved_config["excel_file"] == "test.xlsx"
+        assert saved_config["custom_field_names"] == {"note1": "Anteckning"}
+        assert saved_config["disabled_fields"] == ["kalla2"]
+        assert saved_config["hidden_fields"] == ["kalla2"]
+        assert saved_config["active_template"] == "Min mall"
+
     def test_config_encoding_utf8(self):
         """Test that config files are saved/loaded with UTF-8 encoding"""
         # Create config with Swedish characters
@@ -0,0 +1,97 @@
+"""
+Tests for TemplateManager - template save/load and the session config cache
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to the path so we can import our modules
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.template_manager import TemplateManager
+
+
+class TestTemplateManager:
+    """Test suite for TemplateManager functionality"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        with patch.dict(os.environ, {'APPDATA': self.temp_dir}):
+            self.manager = TemplateManager()
+        self.config = {"custom_names": {"note1": "Anteckning"}, "disabled_fields": ["kalla2"]}
+
+    def teardown_method(self):
+        """Cleanup test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _template_path(self, name):
+        return self.manager.templates_dir / f"{name}.json"
+
+    def test_save_then_load(self):
+        """Test that a saved template loads back with both field list keys"""
+        assert self.manager.save_template("Mall", self.config)
+
+        loaded = self.manager.load_template("Mall")
+
+        assert loaded["custom_names"] == {"note1": "Anteckning"}
+        assert loaded["disabled_fields"] == ["kalla2"]
+        assert loaded["hidden_fields"] == ["kalla2"]
+
+    def test_load_after_save_uses_cache(self):
+        """Test that loading an unchanged template does not read the file again"""
+        self.manager.save_template("Mall", self.config)
+
+        with patch('core.template_manager.json.load') as mock_load:
+            loaded = self.manager.load_template("Mall")
+
+        mock_load.assert_not_called()
+        assert loaded["custom_names"] == {"note1": "Anteckning"}
+
+    def test_cached_template_is_copied(self):
+        """Test that changing a loaded config does not change later loads"""
+        self.manager.save_template("Mall", self.config)
+
+        self.manager.load_template("Mall")["custom_names"]["note2"] = "Ändrad"
+
+        assert self.manager.load_template("Mall")["custom_names"] == {"note1": "Anteckning"}
+
+    def test_load_sees_external_overwrite(self):
+        """Test that a template file rewritten outside the manager is read again"""
+        self.manager.save_template("Mall", self.config)
+        self.manager.load_template("Mall")
+
+        path = self._template_path("Mall")
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        data["field_config"]["custom_names"] = {"note1": "Extern"}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Make sure the mtime moves even on file systems with coarse timestamps
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert self.manager.load_template("Mall")["custom_names"] == {"note1": "Extern"}
+
+    def test_load_after_external_delete(self):
+        """Test that a template file deleted outside the manager is not served from the cache"""
+        self.manager.save_template("Mall", self.config)
+        self.manager.load_template("Mall")
+
+        self._template_path("Mall").unlink()
+
+        assert self.manager.load_template("Mall") is None
+
+    def test_load_after_delete_template(self):
+        """Test that delete_template drops the template"""
+        self.manager.save_template("Mall", self.config)
+        self.manager.load_template("Mall")
+
+        assert self.manager.delete_template("Mall")
+        assert self.manager.load_template("Mall") is None